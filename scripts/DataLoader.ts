@@ -1,4 +1,6 @@
 import { promises as fs } from 'node:fs';
+import { createHash } from 'node:crypto';
+import path from 'node:path';
 import { parse } from 'csv-parse/sync';
 import { ComponentKey, NASARangeType, StateType } from '../src/types/constants';
 import { CompoundTemperatureRanges, ModelSource, NASA9TemperatureRangeData } from '../src/types/external';
@@ -7,6 +9,20 @@ import { Component } from '../src/types/models';
 
 type RawCSVRow = Record<string, string>;
 export type RangeFile = { path: string; range: NASARangeType };
+export type DataLoaderOptions = {
+  // NOTE: directory for a persisted ModelSource cache; caching is off when omitted
+  cacheDir?: string;
+};
+
+// NOTE: part of the cache fingerprint; bump when transformRow, generateKeys or the cache layout change
+const CACHE_FORMAT_VERSION = 1;
+
+// NOTE: persisted ModelSource; each distinct range record is stored once and linked by index per component id
+type ModelSourceCache = {
+  version: number;
+  records: NASA9TemperatureRangeData[];
+  index: Record<string, Partial<Record<NASARangeType, number>>>;
+};
 
 function toNumber(value: string | number | undefined): number | null {
   const num = typeof value === 'number' ? value : Number(value);
@@ -22,15 +38,96 @@ function buildComponent(data: NASA9TemperatureRangeData): Component {
   };
 }
 
+// NOTE: flatten a ModelSource so records shared across component ids are written once
+function toCache(modelSource: ModelSource): ModelSourceCache {
+  const records: NASA9TemperatureRangeData[] = [];
+  const positions = new Map<object, number>();
+  const index: ModelSourceCache['index'] = {};
+
+  for (const [componentId, ranges] of Object.entries(modelSource)) {
+    const entry: Partial<Record<NASARangeType, number>> = {};
+    for (const [range, record] of Object.entries(ranges) as [NASARangeType, NASA9TemperatureRangeData][]) {
+      let position = positions.get(record);
+      if (position === undefined) {
+        position = records.length;
+        records.push(record);
+        positions.set(record, position);
+      }
+      entry[range] = position;
+    }
+    index[componentId] = entry;
+  }
+
+  return { version: CACHE_FORMAT_VERSION, records, index };
+}
+
+// NOTE: rebuild a ModelSource from its cache, re-linking shared records (null if the layout does not match)
+function fromCache(cache: ModelSourceCache): ModelSource | null {
+  if (cache?.version !== CACHE_FORMAT_VERSION || !Array.isArray(cache.records) || !cache.index) {
+    return null;
+  }
+
+  const modelSource: ModelSource = {};
+  for (const [componentId, entry] of Object.entries(cache.index)) {
+    const ranges = {} as CompoundTemperatureRanges;
+    for (const [range, position] of Object.entries(entry) as [NASARangeType, number][]) {
+      const record = cache.records[position];
+      if (!record) return null;
+      ranges[range] = record;
+    }
+    modelSource[componentId] = ranges;
+  }
+  return modelSource;
+}
+
 // SECTION: DataLoader Class for loading NASA polynomial data from CSV files
 export class DataLoader {
-  constructor(private readonly rangeFiles: RangeFile[]) {
+  constructor(
+    private readonly rangeFiles: RangeFile[],
+    private readonly options: DataLoaderOptions = {}
+  ) {
     if (!rangeFiles.length) {
       throw new Error('DataLoader requires at least one CSV path; data must be supplied externally.');
     }
   }
 
   async loadModelSource(): Promise<ModelSource> {
+    const { cacheDir } = this.options;
+    if (!cacheDir) {
+      return this.parseModelSource();
+    }
+
+    // NOTE: reuse a persisted ModelSource when the CSV inputs are unchanged
+    const cachePath = path.join(cacheDir, `${await this.fingerprint()}.json`);
+    try {
+      const cached = fromCache(JSON.parse(await fs.readFile(cachePath, 'utf-8')));
+      if (cached) return cached;
+    } catch {
+      // cache miss or unreadable cache; fall through to parsing
+    }
+
+    const modelSource = await this.parseModelSource();
+    try {
+      await fs.mkdir(cacheDir, { recursive: true });
+      await fs.writeFile(cachePath, JSON.stringify(toCache(modelSource)), 'utf-8');
+    } catch {
+      // caching is best effort
+    }
+    return modelSource;
+  }
+
+  // NOTE: fingerprint of the cache format and the inputs (range, path, size, mtime) used as the cache key
+  private async fingerprint(): Promise<string> {
+    const hash = createHash('sha1');
+    hash.update(`v${CACHE_FORMAT_VERSION}\n`);
+    for (const { path: filePath, range } of this.rangeFiles) {
+      const stat = await fs.stat(filePath);
+      hash.update(`${range}|${path.resolve(filePath)}|${stat.size}|${stat.mtimeMs}\n`);
+    }
+    return hash.digest('hex');
+  }
+
+  private async parseModelSource(): Promise<ModelSource> {
     const modelSource: ModelSource = {};
 
     for (const { path: filePath, range } of this.rangeFiles) {
@@ -130,7 +227,7 @@ export class DataLoader {
   }
 }
 
-export async function loadModelSource(rangeFiles: RangeFile[]): Promise<ModelSource> {
-  const loader = new DataLoader(rangeFiles);
+export async function loadModelSource(rangeFiles: RangeFile[], options?: DataLoaderOptions): Promise<ModelSource> {
+  const loader = new DataLoader(rangeFiles, options);
   return loader.loadModelSource();
 }
@@ -9,30 +9,461 @@ import {
   ComponentKey,
   BasisType,
   PRESSURE_REF_Pa,
-  TEMPERATURE_BREAK_NASA7_1000_K,
-  TEMPERATURE_BREAK_NASA7_6000_K,
-  TEMPERATURE_BREAK_NASA9_1000_K,
-  TEMPERATURE_BREAK_NASA9_6000_K
+  R_CONST_J__molK,
+  TEMPERATURE_REF_K
 } from './types/constants';
-import { Component, CustomProp, Temperature } from './types/models';
+import { Component, CustomProp, CustomPropArray, Temperature } from './types/models';
 import { ModelSource, Reaction } from './types/external';
-import { selectNasaType } from './utils/tools';
+import { NASA_RANGES, nasaRangeIndex, selectNasaRangeK } from './utils/tools';
+import { toKelvin } from './utils/unitConverter';
+import { ensureEnergy } from './utils/conversions';
 import { Source } from './core/Source';
-import { setComponentId } from './utils/component';
 
 
+// NOTE: helper to select the NASA range for a temperature against the hoisted breaks
+function selectNasaRange(temperature: Temperature, nasa_type: NASAType): NASARangeType {
+  return selectNasaRangeK(toKelvin(temperature), nasa_type);
+}
+
+// NOTE: Source instances cached per model source (weakly held) and component key
+const SOURCE_CACHE = new WeakMap<ModelSource, Map<ComponentKey, Source>>();
+
+// NOTE: helper to get a cached Source for a model source and component key
+function getSource(model_source: ModelSource, component_key: ComponentKey): Source {
+  let sources = SOURCE_CACHE.get(model_source);
+  if (!sources) {
+    sources = new Map();
+    SOURCE_CACHE.set(model_source, sources);
+  }
+
+  let source = sources.get(component_key);
+  if (!source) {
+    source = new Source(model_source, component_key);
+    sources.set(component_key, source);
+  }
+  return source;
+}
+
+// NOTE: HSG/HSGs instances cached per Source (weakly held), each bounded to the most recently used entries
+const HSG_CACHE = new WeakMap<Source, Map<string, HSG>>();
+const HSGS_CACHE = new WeakMap<Source, Map<string, HSGs>>();
+const HSG_CACHE_SIZE = 1024;
+const HSGS_CACHE_SIZE = 128;
+
+// NOTE: helper to get or build an entry of a bounded LRU cache (Map insertion order tracks recency)
+function lruGet<K, V>(cache: Map<K, V>, key: K, limit: number, build: () => V): V {
+  let value = cache.get(key);
+  if (value !== undefined) {
+    // ! refresh recency
+    cache.delete(key);
+    cache.set(key, value);
+    return value;
+  }
+
+  value = build();
+  cache.set(key, value);
+  if (cache.size > limit) {
+    // ! evict the least recently used entry
+    cache.delete(cache.keys().next().value as K);
+  }
+  return value;
+}
+
+// NOTE: helper to build a canonical cache key for a component
+function componentCacheKey(component: Component): string {
+  return `${component.name}|${component.formula}|${component.state}`;
+}
+
+// NOTE: helper to get a cached HSG for a component, NASA type and basis
+function getHSG(opts: {
+  source: Source;
+  component: Component;
+  component_key: ComponentKey;
+  nasa_type: NASAType;
+  basis: BasisType;
+}): HSG {
+  const { source, component, component_key, nasa_type, basis } = opts;
+
+  let cache = HSG_CACHE.get(source);
+  if (!cache) {
+    cache = new Map();
+    HSG_CACHE.set(source, cache);
+  }
+
+  const key = `${componentCacheKey(component)}#${component_key}#${nasa_type}#${basis}`;
+  return lruGet(cache, key, HSG_CACHE_SIZE, () => new HSG({ source, component, component_key, nasa_type, basis }));
+}
+
+// NOTE: helper to get a cached HSGs for a component set and NASA type
+function getHSGs(opts: {
+  source: Source;
+  components: Component[];
+  component_key: ComponentKey;
+  nasa_type: NASAType;
+}): HSGs {
+  const { source, components, component_key, nasa_type } = opts;
+
+  let cache = HSGS_CACHE.get(source);
+  if (!cache) {
+    cache = new Map();
+    HSGS_CACHE.set(source, cache);
+  }
+
+  const key = `${components.map(componentCacheKey).join(';')}#${component_key}#${nasa_type}`;
+  return lruGet(cache, key, HSGS_CACHE_SIZE, () => new HSGs(source, components, component_key, nasa_type));
+}
+
+// NOTE: HSG method used for each single-component property
+const HSG_METHODS = {
+  H: 'calc_absolute_enthalpy',
+  S: 'calc_absolute_entropy',
+  G: 'calc_gibbs_free_energy',
+  Cp: 'calc_heat_capacity'
+} as const;
+
+type ComponentPropName = keyof typeof HSG_METHODS;
+
+// NOTE: helper to calculate a single-component property at given temperature
+function calcComponentProp(
+  opts: {
+    component: Component;
+    temperature: Temperature;
+    model_source: ModelSource;
+    component_key?: ComponentKey;
+    nasa_type?: NASAType;
+    basis?: BasisType;
+  },
+  prop: ComponentPropName
+): CustomProp | null {
+  const {
+    component,
+    temperature,
+    model_source,
+    component_key = 'Name-Formula',
+    nasa_type = 'nasa9',
+    basis = 'molar'
+  } = opts;
+
+  const Source_ = getSource(model_source, component_key);
+  const hsg = getHSG({
+    source: Source_,
+    component,
+    component_key,
+    nasa_type,
+    basis
+  });
+
+  const nasa_type_selected = selectNasaRange(temperature, nasa_type);
+  return hsg[HSG_METHODS[prop]](temperature, nasa_type_selected);
+}
+
+// NOTE: helper to calculate a single-component property over a temperature list, resolving the HSG once
+function calcComponentPropSeries(
+  opts: {
+    component: Component;
+    temperature_list: Temperature[];
+    model_source: ModelSource;
+    component_key?: ComponentKey;
+    nasa_type?: NASAType;
+    basis?: BasisType;
+  },
+  prop: ComponentPropName
+): Array<{ temperature: Temperature; result: CustomProp | null }> {
+  const {
+    component,
+    temperature_list,
+    model_source,
+    component_key = 'Name-Formula',
+    nasa_type = 'nasa9',
+    basis = 'molar'
+  } = opts;
+  if (!temperature_list.length) return [];
+
+  const Source_ = getSource(model_source, component_key);
+  const hsg = getHSG({
+    source: Source_,
+    component,
+    component_key,
+    nasa_type,
+    basis
+  });
+
+  const method = HSG_METHODS[prop];
+  return temperature_list.map((temperature) => ({
+    temperature,
+    result: hsg[method](temperature, selectNasaRange(temperature, nasa_type))
+  }));
+}
+
+// NOTE: HSG vectorized method used for each batch property
+const HSG_VEC_METHODS = {
+  H: 'calc_absolute_enthalpy_vec',
+  S: 'calc_absolute_entropy_vec',
+  G: 'calc_gibbs_free_energy_vec',
+  Cp: 'calc_heat_capacity_vec'
+} as const;
+
+// NOTE: helper to calculate a single-component property over Kelvin temperatures
+function calcComponentPropBatch(
+  opts: {
+    component: Component;
+    temperatures_K: ArrayLike<number>;
+    model_source: ModelSource;
+    component_key?: ComponentKey;
+    nasa_type?: NASAType;
+    basis?: BasisType;
+  },
+  prop: keyof typeof HSG_VEC_METHODS
+): CustomPropArray | null {
+  const {
+    component,
+    temperatures_K,
+    model_source,
+    component_key = 'Name-Formula',
+    nasa_type = 'nasa9',
+    basis = 'molar'
+  } = opts;
+
+  const Source_ = getSource(model_source, component_key);
+  const hsg = getHSG({
+    source: Source_,
+    component,
+    component_key,
+    nasa_type,
+    basis
+  });
+
+  return hsg[HSG_VEC_METHODS[prop]](temperatures_K);
+}
+
+// NOTE: RXNAdapter instances cached per reaction (weakly held)
+const RXN_ADAPTER_CACHE = new WeakMap<Reaction, RXNAdapter>();
+
+// NOTE: helper to get a cached RXNAdapter for a reaction
+function getRXNAdapter(reaction: Reaction): RXNAdapter {
+  let rxn_adapter = RXN_ADAPTER_CACHE.get(reaction);
+  if (!rxn_adapter) {
+    rxn_adapter = new RXNAdapter(reaction);
+    RXN_ADAPTER_CACHE.set(reaction, rxn_adapter);
+  }
+  return rxn_adapter;
+}
+
 // NOTE: helper to build reaction context
 function buildReactionContext(opts: {
   reaction: Reaction;
   model_source: ModelSource;
   component_key: ComponentKey;
   nasa_type: NASAType;
-}): { rxn_adapter: RXNAdapter; hsgs: HSGs } {
+}): ReactionContext {
   const { reaction, model_source, component_key, nasa_type } = opts;
-  const Source_ = new Source(model_source, component_key);
-  const rxn_adapter = new RXNAdapter(reaction);
-  const hsgs = new HSGs(Source_, rxn_adapter.components, component_key, nasa_type);
-  return { rxn_adapter, hsgs };
+  const Source_ = getSource(model_source, component_key);
+  const rxn_adapter = getRXNAdapter(reaction);
+  const hsgs = getHSGs({
+    source: Source_,
+    components: rxn_adapter.components,
+    component_key,
+    nasa_type
+  });
+  return { rxn_adapter, hsgs, standard_state: undefined };
+}
+
+// NOTE: reaction property evaluated on a prepared reaction context
+// standard_state holds ΔH° and Keq° at 298.15 K once first needed (undefined until then), shared by every
+// temperature evaluated on the context
+type ReactionStandardState = { dH_std: CustomProp; Keq_STD: CustomProp };
+type ReactionContext = { rxn_adapter: RXNAdapter; hsgs: HSGs; standard_state: ReactionStandardState | null | undefined };
+type ReactionPropFn = (ctx: ReactionContext, temperature: Temperature) => CustomProp | null;
+
+// NOTE: standard temperature shared by all reaction calls (frozen, never rebuilt per call)
+const STANDARD_TEMPERATURE: Readonly<Temperature> = Object.freeze({ value: TEMPERATURE_REF_K, unit: 'K' });
+
+// NOTE: helper to get reaction enthalpy and equilibrium constant at the standard temperature (memoised on the context)
+function calcReactionStandardState(ctx: ReactionContext): ReactionStandardState | null {
+  if (ctx.standard_state === undefined) {
+    ctx.standard_state = buildReactionStandardState(ctx);
+  }
+  return ctx.standard_state;
+}
+
+// NOTE: helper to calculate reaction enthalpy and equilibrium constant at the standard temperature
+function buildReactionStandardState(ctx: ReactionContext): ReactionStandardState | null {
+  const std = calcReactionStdMulti(ctx, STANDARD_TEMPERATURE, ['enthalpy', 'gibbs'] as const);
+  if (!std) return null;
+  const dH_std = std.enthalpy;
+
+  const Keq_STD = ctx.rxn_adapter.Keq({ dG_rxn_STD: std.gibbs, temperature: STANDARD_TEMPERATURE });
+  if (!Keq_STD) return null;
+
+  return { dH_std, Keq_STD };
+}
+
+// NOTE: RXNAdapter vector method per component property
+const RXN_VEC_METHODS = {
+  enthalpy: 'dH_rxn_std_vec',
+  entropy: 'dS_rxn_std_vec',
+  gibbs: 'dG_rxn_std_vec',
+  heat_capacity: 'dCp_rxn_std_vec'
+} as const;
+
+// NOTE: helper to calculate a standard reaction property from the component vector
+// HSGs values are already in J/mol or J/mol.K, so the unit-checked per-component path is skipped
+function calcReactionStd(
+  { rxn_adapter, hsgs }: ReactionContext,
+  temperature: Temperature,
+  prop_name: keyof typeof RXN_VEC_METHODS
+): CustomProp | null {
+  const vec = hsgs.calc_components_hsg_vec(temperature, prop_name);
+  if (!vec) return null;
+
+  return rxn_adapter[RXN_VEC_METHODS[prop_name]](vec);
+}
+
+// NOTE: helper to calculate several standard reaction properties from one HSGs pass (null if any fails)
+function calcReactionStdMulti<P extends keyof typeof RXN_VEC_METHODS>(
+  { rxn_adapter, hsgs }: ReactionContext,
+  temperature: Temperature,
+  prop_names: readonly P[]
+): Record<P, CustomProp> | null {
+  const vec = hsgs.calc_components_hsg_vec_multi(temperature, prop_names);
+  if (!vec) return null;
+
+  const res = {} as Record<P, CustomProp>;
+  for (const prop_name of prop_names) {
+    const prop = rxn_adapter[RXN_VEC_METHODS[prop_name]]({ reaction_ids: vec.reaction_ids, values: vec.values[prop_name] });
+    if (!prop) return null;
+    res[prop_name] = prop;
+  }
+  return res;
+}
+
+// NOTE: reaction properties shared by the scalar and series helpers
+const REACTION_PROPS = {
+  dG_rxn_STD: (ctx, temperature) => calcReactionStd(ctx, temperature, 'gibbs'),
+  dS_rxn_STD: (ctx, temperature) => calcReactionStd(ctx, temperature, 'entropy'),
+  dH_rxn_STD: (ctx, temperature) => calcReactionStd(ctx, temperature, 'enthalpy'),
+  dCp_rxn_STD: (ctx, temperature) => calcReactionStd(ctx, temperature, 'heat_capacity'),
+  Keq: (ctx, temperature) => {
+    const dG = calcReactionStd(ctx, temperature, 'gibbs');
+    if (!dG) return null;
+
+    return ctx.rxn_adapter.Keq({ dG_rxn_STD: dG, temperature });
+  },
+  Keq_vh_shortcut: (ctx, temperature) => {
+    const std = calcReactionStandardState(ctx);
+    if (!std) return null;
+
+    return ctx.rxn_adapter.Keq_vh_shortcut({
+      Keq_STD: std.Keq_STD,
+      dH_rxn_STD: std.dH_std,
+      temperature
+    });
+  },
+  dlnKeq_dT: (ctx, temperature) => {
+    const dH = calcReactionStd(ctx, temperature, 'enthalpy');
+    if (!dH) return null;
+
+    return ctx.rxn_adapter.dlnKeq_dT({ dH_rxn_STD: dH, temperature });
+  },
+  dG_rxn_dT: (ctx, temperature) => {
+    const dS = calcReactionStd(ctx, temperature, 'entropy');
+    if (!dS) return null;
+
+    return ctx.rxn_adapter.dG_rxn_dT({ dS_rxn_STD: dS });
+  },
+  dlnK_dInvT: (ctx, temperature) => {
+    const dH = calcReactionStd(ctx, temperature, 'enthalpy');
+    if (!dH) return null;
+
+    return ctx.rxn_adapter.dlnK_dInvT({ dH_rxn_STD: dH });
+  },
+  dlnK_dH: ({ rxn_adapter }, temperature) => rxn_adapter.dlnK_dH({ temperature }),
+  dH_rxn_dT: (ctx, temperature) => {
+    const dCp = calcReactionStd(ctx, temperature, 'heat_capacity');
+    if (!dCp) return null;
+
+    return ctx.rxn_adapter.dH_rxn_dT({ dCp_rxn_STD: dCp });
+  },
+  dS_rxn_dT: (ctx, temperature) => {
+    const dCp = calcReactionStd(ctx, temperature, 'heat_capacity');
+    if (!dCp) return null;
+
+    return ctx.rxn_adapter.dS_rxn_dT({ dCp_rxn_STD: dCp, temperature });
+  },
+  d2lnK_dT2: (ctx, temperature) => {
+    const std = calcReactionStdMulti(ctx, temperature, ['enthalpy', 'heat_capacity'] as const);
+    if (!std) return null;
+
+    return ctx.rxn_adapter.d2lnK_dT2({ dH_rxn_STD: std.enthalpy, dCp_rxn_STD: std.heat_capacity, temperature });
+  }
+} satisfies Record<string, ReactionPropFn>;
+
+type ReactionPropName = keyof typeof REACTION_PROPS;
+
+// NOTE: reaction options shared by the scalar and series helpers
+type ReactionOpts = {
+  reaction: Reaction;
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+};
+
+// NOTE: helper to calculate a reaction property at given temperature
+function calcReactionProp(opts: ReactionOpts & { temperature: Temperature }, prop: ReactionPropName): CustomProp | null {
+  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
+
+  const ctx = buildReactionContext({ reaction, model_source, component_key, nasa_type });
+  return REACTION_PROPS[prop](ctx, temperature);
+}
+
+// NOTE: helper to calculate a reaction property over a temperature list, building the context once
+function calcReactionPropSeries(
+  opts: ReactionOpts & { temperature_list: Temperature[] },
+  prop: ReactionPropName
+): Array<{ temperature: Temperature; result: CustomProp | null }> {
+  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
+  if (!temperature_list.length) return [];
+
+  const ctx = buildReactionContext({ reaction, model_source, component_key, nasa_type });
+  const calc = REACTION_PROPS[prop];
+  return temperature_list.map((temperature) => ({
+    temperature,
+    result: calc(ctx, temperature)
+  }));
+}
+
+// NOTE: helper to calculate reaction Gibbs energy over Kelvin temperatures on a prepared reaction context
+// temperatures are grouped by NASA range so each group is one (temperatures x components) evaluation;
+// null only when the reaction's components resolve in no NASA range (invalid temperatures give NaN)
+function calcReactionGibbsBatch(
+  ctx: ReactionContext,
+  temperatures_K: ArrayLike<number>,
+  nasa_type: NASAType
+): Float64Array | null {
+  const { rxn_adapter, hsgs } = ctx;
+  const ranges = NASA_RANGES[nasa_type];
+  const resolved = ranges.map(
+    (range) => rxn_adapter.stoichiometry_vector(hsgs.get_range_coefficients(range).reaction_ids) !== null
+  );
+  if (!resolved.includes(true)) return null;
+
+  const dG = new Float64Array(temperatures_K.length).fill(NaN);
+
+  const groups: number[][] = [[], [], []];
+  for (let i = 0; i < temperatures_K.length; i++) {
+    const T = temperatures_K[i];
+    if (Number.isFinite(T) && T > 0) groups[nasaRangeIndex(T, nasa_type)].push(i);
+  }
+
+  groups.forEach((idx, r) => {
+    if (!idx.length || !resolved[r]) return;
+    const G = hsgs.calc_range_hsg_batch(ranges[r], Float64Array.from(idx, (i) => temperatures_K[i]), 'gibbs');
+    const dG_range = rxn_adapter.dG_rxn_std_mat(G);
+    if (!dG_range) return;
+    idx.forEach((i, k) => (dG[i] = dG_range[k]));
+  });
+
+  return dG;
 }
 
 // NOTE: helper to build mixture context
@@ -43,9 +474,9 @@ function buildMixtureContext(opts: {
   nasa_type: NASAType;
 }): { mixture: MIXTURE; hsgs: HSGs; source: Source } {
   const { components, model_source, component_key, nasa_type } = opts;
-  const Source_ = new Source(model_source, component_key);
+  const Source_ = getSource(model_source, component_key);
   const mixture = new MIXTURE(components);
-  const hsgs = new HSGs(Source_, components, component_key, nasa_type);
+  const hsgs = getHSGs({ source: Source_, components, component_key, nasa_type });
   return { mixture, hsgs, source: Source_ };
 }
 
@@ -56,18 +487,38 @@ function buildComponentPropsByName(opts: {
   temperature: Temperature;
   prop_name: 'enthalpy' | 'entropy' | 'gibbs' | 'heat_capacity';
 }): Record<string, CustomProp> | null {
-  const { components, component_key, hsgs, temperature, prop_name } = opts;
-  const propsById = hsgs.calc_components_hsg(temperature, prop_name);
-  if (!propsById) return null;
+  const { prop_name, ...rest } = opts;
+  return buildComponentPropsByNameMulti({ ...rest, prop_names: [prop_name] })?.[prop_name] ?? null;
+}
 
-  const propsByName: Record<string, CustomProp> = {};
-  for (const component of components) {
-    const id = setComponentId({ component, componentKey: component_key });
-    const prop = propsById[id];
-    if (!prop) return null;
-    propsByName[component.name] = prop;
+// NOTE: helper to build several component property maps in one HSGs pass (null entry per failed property)
+function buildComponentPropsByNameMulti<P extends 'enthalpy' | 'entropy' | 'gibbs' | 'heat_capacity'>(opts: {
+  components: Component[];
+  component_key: ComponentKey;
+  hsgs: HSGs;
+  temperature: Temperature;
+  prop_names: readonly P[];
+}): Record<P, Record<string, CustomProp> | null> | null {
+  const { components, hsgs, temperature, prop_names } = opts;
+
+  // NOTE: hsgs is built for this exact component list, so values are aligned by index
+  const ordered = hsgs.calc_components_hsg_ordered_multi(temperature, prop_names);
+  if (!ordered) return null;
+
+  const res = {} as Record<P, Record<string, CustomProp> | null>;
+  for (const prop_name of prop_names) {
+    const { values, unit } = ordered[prop_name];
+    let propsByName: Record<string, CustomProp> | null = {};
+    for (let i = 0; i < components.length; i++) {
+      if (Number.isNaN(values[i])) {
+        propsByName = null;
+        break;
+      }
+      propsByName[components[i].name] = { value: values[i], unit };
+    }
+    res[prop_name] = propsByName && Object.keys(propsByName).length ? propsByName : null;
   }
-  return Object.keys(propsByName).length ? propsByName : null;
+  return res;
 }
 
 function buildMWByName(opts: {
@@ -79,17 +530,7 @@ function buildMWByName(opts: {
 }): Record<string, number> | null {
   const { components, component_key, source, nasa_type, temperature } = opts;
 
-  const nasa_temperature_break_min_value =
-    nasa_type === 'nasa7' ? TEMPERATURE_BREAK_NASA7_1000_K : TEMPERATURE_BREAK_NASA9_1000_K;
-  const nasa_temperature_break_max_value =
-    nasa_type === 'nasa7' ? TEMPERATURE_BREAK_NASA7_6000_K : TEMPERATURE_BREAK_NASA9_6000_K;
-
-  const nasa_type_selected = selectNasaType(
-    temperature,
-    { value: nasa_temperature_break_min_value, unit: 'K' },
-    { value: nasa_temperature_break_max_value, unit: 'K' },
-    nasa_type
-  ) as NASARangeType;
+  const nasa_type_selected = selectNasaRange(temperature, nasa_type);
 
   const MW_i: Record<string, number> = {};
   for (const component of components) {
@@ -127,37 +568,7 @@ export function H_T(opts: {
   nasa_type?: NASAType;
   basis?: BasisType;
 }): CustomProp | null {
-  const {
-    component,
-    temperature,
-    model_source,
-    component_key = 'Name-Formula',
-    nasa_type = 'nasa9',
-    basis = 'molar'
-  } = opts;
-
-  const Source_ = new Source(model_source, component_key);
-  const hsg = new HSG({
-    source: Source_,
-    component,
-    component_key,
-    nasa_type,
-    basis
-  });
-
-  const nasa_temperature_break_min_value =
-    nasa_type === 'nasa7' ? TEMPERATURE_BREAK_NASA7_1000_K : TEMPERATURE_BREAK_NASA9_1000_K;
-  const nasa_temperature_break_max_value =
-    nasa_type === 'nasa7' ? TEMPERATURE_BREAK_NASA7_6000_K : TEMPERATURE_BREAK_NASA9_6000_K;
-
-  const nasa_type_selected = selectNasaType(
-    temperature,
-    { value: nasa_temperature_break_min_value, unit: 'K' },
-    { value: nasa_temperature_break_max_value, unit: 'K' },
-    nasa_type
-  ) as NASARangeType;
-
-  return hsg.calc_absolute_enthalpy(temperature, nasa_type_selected);
+  return calcComponentProp(opts, 'H');
 }
 
 /**
@@ -179,12 +590,29 @@ export function H_T_series(opts: {
   nasa_type?: NASAType;
   basis?: BasisType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { component, temperature_list, model_source, component_key, nasa_type, basis } = opts;
+  return calcComponentPropSeries(opts, 'H');
+}
 
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: H_T({ component, temperature, model_source, component_key, nasa_type, basis })
-  }));
+/**
+ * SECTION: Calculate enthalpy over an array of Kelvin temperatures for a component
+ * @param opts - Options object
+ * @param opts.component - The component to calculate enthalpy for
+ * @param opts.temperatures_K - Temperatures in Kelvin (number[] or Float64Array)
+ * @param opts.model_source - The NASA model source data
+ * @param opts.component_key - Component identifier key (default: 'Name-Formula')
+ * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
+ * @param opts.basis - Calculation basis, 'molar' or 'mass' (default: 'molar')
+ * @returns CustomPropArray | null - Enthalpy values aligned with temperatures_K (NaN where a temperature has no data), or null if no coefficients are found
+ */
+export function H_T_batch(opts: {
+  component: Component;
+  temperatures_K: ArrayLike<number>;
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+  basis?: BasisType;
+}): CustomPropArray | null {
+  return calcComponentPropBatch(opts, 'H');
 }
 
 /**
@@ -206,37 +634,7 @@ export function S_T(opts: {
   nasa_type?: NASAType;
   basis?: BasisType;
 }): CustomProp | null {
-  const {
-    component,
-    temperature,
-    model_source,
-    component_key = 'Name-Formula',
-    nasa_type = 'nasa9',
-    basis = 'molar'
-  } = opts;
-
-  const Source_ = new Source(model_source, component_key);
-  const hsg = new HSG({
-    source: Source_,
-    component,
-    component_key,
-    nasa_type,
-    basis
-  });
-
-  const nasa_temperature_break_min_value =
-    nasa_type === 'nasa7' ? TEMPERATURE_BREAK_NASA7_1000_K : TEMPERATURE_BREAK_NASA9_1000_K;
-  const nasa_temperature_break_max_value =
-    nasa_type === 'nasa7' ? TEMPERATURE_BREAK_NASA7_6000_K : TEMPERATURE_BREAK_NASA9_6000_K;
-
-  const nasa_type_selected = selectNasaType(
-    temperature,
-    { value: nasa_temperature_break_min_value, unit: 'K' },
-    { value: nasa_temperature_break_max_value, unit: 'K' },
-    nasa_type
-  ) as NASARangeType;
-
-  return hsg.calc_absolute_entropy(temperature, nasa_type_selected);
+  return calcComponentProp(opts, 'S');
 }
 
 /**
@@ -258,12 +656,29 @@ export function S_T_series(opts: {
   nasa_type?: NASAType;
   basis?: BasisType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { component, temperature_list, model_source, component_key, nasa_type, basis } = opts;
+  return calcComponentPropSeries(opts, 'S');
+}
 
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: S_T({ component, temperature, model_source, component_key, nasa_type, basis })
-  }));
+/**
+ * SECTION: Calculate entropy over an array of Kelvin temperatures for a component
+ * @param opts - Options object
+ * @param opts.component - The component to calculate entropy for
+ * @param opts.temperatures_K - Temperatures in Kelvin (number[] or Float64Array)
+ * @param opts.model_source - The NASA model source data
+ * @param opts.component_key - Component identifier key (default: 'Name-Formula')
+ * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
+ * @param opts.basis - Calculation basis, 'molar' or 'mass' (default: 'molar')
+ * @returns CustomPropArray | null - Entropy values aligned with temperatures_K (NaN where a temperature has no data), or null if no coefficients are found
+ */
+export function S_T_batch(opts: {
+  component: Component;
+  temperatures_K: ArrayLike<number>;
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+  basis?: BasisType;
+}): CustomPropArray | null {
+  return calcComponentPropBatch(opts, 'S');
 }
 
 /**
@@ -285,37 +700,7 @@ export function G_T(opts: {
   nasa_type?: NASAType;
   basis?: BasisType;
 }): CustomProp | null {
-  const {
-    component,
-    temperature,
-    model_source,
-    component_key = 'Name-Formula',
-    nasa_type = 'nasa9',
-    basis = 'molar'
-  } = opts;
-
-  const Source_ = new Source(model_source, component_key);
-  const hsg = new HSG({
-    source: Source_,
-    component,
-    component_key,
-    nasa_type,
-    basis
-  });
-
-  const nasa_temperature_break_min_value =
-    nasa_type === 'nasa7' ? TEMPERATURE_BREAK_NASA7_1000_K : TEMPERATURE_BREAK_NASA9_1000_K;
-  const nasa_temperature_break_max_value =
-    nasa_type === 'nasa7' ? TEMPERATURE_BREAK_NASA7_6000_K : TEMPERATURE_BREAK_NASA9_6000_K;
-
-  const nasa_type_selected = selectNasaType(
-    temperature,
-    { value: nasa_temperature_break_min_value, unit: 'K' },
-    { value: nasa_temperature_break_max_value, unit: 'K' },
-    nasa_type
-  ) as NASARangeType;
-
-  return hsg.calc_gibbs_free_energy(temperature, nasa_type_selected);
+  return calcComponentProp(opts, 'G');
 }
 
 /**
@@ -337,12 +722,29 @@ export function G_T_series(opts: {
   nasa_type?: NASAType;
   basis?: BasisType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { component, temperature_list, model_source, component_key, nasa_type, basis } = opts;
+  return calcComponentPropSeries(opts, 'G');
+}
 
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: G_T({ component, temperature, model_source, component_key, nasa_type, basis })
-  }));
+/**
+ * SECTION: Calculate Gibbs free energy over an array of Kelvin temperatures for a component
+ * @param opts - Options object
+ * @param opts.component - The component to calculate Gibbs free energy for
+ * @param opts.temperatures_K - Temperatures in Kelvin (number[] or Float64Array)
+ * @param opts.model_source - The NASA model source data
+ * @param opts.component_key - Component identifier key (default: 'Name-Formula')
+ * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
+ * @param opts.basis - Calculation basis, 'molar' or 'mass' (default: 'molar')
+ * @returns CustomPropArray | null - Gibbs free energy values aligned with temperatures_K (NaN where a temperature has no data), or null if no coefficients are found
+ */
+export function G_T_batch(opts: {
+  component: Component;
+  temperatures_K: ArrayLike<number>;
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+  basis?: BasisType;
+}): CustomPropArray | null {
+  return calcComponentPropBatch(opts, 'G');
 }
 
 /**
@@ -364,6 +766,72 @@ export function Cp_T(opts: {
   nasa_type?: NASAType;
   basis?: BasisType;
 }): CustomProp | null {
+  return calcComponentProp(opts, 'Cp');
+}
+
+/**
+ * SECTION: Calculate heat capacity over a temperature list for a component
+ * @param opts - Options object
+ * @param opts.component - The component to calculate heat capacity for
+ * @param opts.temperature_list - Temperatures to evaluate
+ * @param opts.model_source - The NASA model source data
+ * @param opts.component_key - Component identifier key (default: 'Name-Formula')
+ * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
+ * @param opts.basis - Calculation basis, 'molar' or 'mass' (default: 'molar')
+ * @returns Array<{ temperature: Temperature; result: CustomProp | null }>
+ */
+export function Cp_T_series(opts: {
+  component: Component;
+  temperature_list: Temperature[];
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+  basis?: BasisType;
+}): Array<{ temperature: Temperature; result: CustomProp | null }> {
+  return calcComponentPropSeries(opts, 'Cp');
+}
+
+/**
+ * SECTION: Calculate heat capacity over an array of Kelvin temperatures for a component
+ * @param opts - Options object
+ * @param opts.component - The component to calculate heat capacity for
+ * @param opts.temperatures_K - Temperatures in Kelvin (number[] or Float64Array)
+ * @param opts.model_source - The NASA model source data
+ * @param opts.component_key - Component identifier key (default: 'Name-Formula')
+ * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
+ * @param opts.basis - Calculation basis, 'molar' or 'mass' (default: 'molar')
+ * @returns CustomPropArray | null - Heat capacity values aligned with temperatures_K (NaN where a temperature has no data), or null if no coefficients are found
+ */
+export function Cp_T_batch(opts: {
+  component: Component;
+  temperatures_K: ArrayLike<number>;
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+  basis?: BasisType;
+}): CustomPropArray | null {
+  return calcComponentPropBatch(opts, 'Cp');
+}
+
+/**
+ * SECTION: Calculate enthalpy, entropy, Gibbs free energy and heat capacity at given temperature for a component
+ * @param opts - Options object
+ * @param opts.component - The component to calculate properties for
+ * @param opts.temperature - The temperature at which to calculate
+ * @param opts.model_source - The NASA model source data
+ * @param opts.component_key - Component identifier key (default: 'Name-Formula')
+ * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
+ * @param opts.basis - Calculation basis, 'molar' or 'mass' (default: 'molar')
+ * @returns { H, S, G, Cp } | null - The calculated properties or null if calculation fails
+ */
+export function HSCp_T(opts: {
+  component: Component;
+  temperature: Temperature;
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+  basis?: BasisType;
+}): { H: CustomProp; S: CustomProp; G: CustomProp; Cp: CustomProp } | null {
   const {
     component,
     temperature,
@@ -373,8 +841,8 @@ export function Cp_T(opts: {
     basis = 'molar'
   } = opts;
 
-  const Source_ = new Source(model_source, component_key);
-  const hsg = new HSG({
+  const Source_ = getSource(model_source, component_key);
+  const hsg = getHSG({
     source: Source_,
     component,
     component_key,
@@ -382,46 +850,8 @@ export function Cp_T(opts: {
     basis
   });
 
-  const nasa_temperature_break_min_value =
-    nasa_type === 'nasa7' ? TEMPERATURE_BREAK_NASA7_1000_K : TEMPERATURE_BREAK_NASA9_1000_K;
-  const nasa_temperature_break_max_value =
-    nasa_type === 'nasa7' ? TEMPERATURE_BREAK_NASA7_6000_K : TEMPERATURE_BREAK_NASA9_6000_K;
-
-  const nasa_type_selected = selectNasaType(
-    temperature,
-    { value: nasa_temperature_break_min_value, unit: 'K' },
-    { value: nasa_temperature_break_max_value, unit: 'K' },
-    nasa_type
-  ) as NASARangeType;
-
-  return hsg.calc_heat_capacity(temperature, nasa_type_selected);
-}
-
-/**
- * SECTION: Calculate heat capacity over a temperature list for a component
- * @param opts - Options object
- * @param opts.component - The component to calculate heat capacity for
- * @param opts.temperature_list - Temperatures to evaluate
- * @param opts.model_source - The NASA model source data
- * @param opts.component_key - Component identifier key (default: 'Name-Formula')
- * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
- * @param opts.basis - Calculation basis, 'molar' or 'mass' (default: 'molar')
- * @returns Array<{ temperature: Temperature; result: CustomProp | null }>
- */
-export function Cp_T_series(opts: {
-  component: Component;
-  temperature_list: Temperature[];
-  model_source: ModelSource;
-  component_key?: ComponentKey;
-  nasa_type?: NASAType;
-  basis?: BasisType;
-}): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { component, temperature_list, model_source, component_key, nasa_type, basis } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: Cp_T({ component, temperature, model_source, component_key, nasa_type, basis })
-  }));
+  const nasa_type_selected = selectNasaRange(temperature, nasa_type);
+  return hsg.calc_all(temperature, nasa_type_selected);
 }
 
 /**
@@ -1019,34 +1449,18 @@ export function mixture_properties_T(opts: {
     nasa_type
   });
 
-  const H_i_IG = buildComponentPropsByName({
-    components,
-    component_key,
-    hsgs,
-    temperature,
-    prop_name: 'enthalpy'
-  });
-  const S_i_IG = buildComponentPropsByName({
-    components,
-    component_key,
-    hsgs,
-    temperature,
-    prop_name: 'entropy'
-  });
-  const G_i_IG = buildComponentPropsByName({
-    components,
-    component_key,
-    hsgs,
-    temperature,
-    prop_name: 'gibbs'
-  });
-  const Cp_i_IG = buildComponentPropsByName({
+  // NOTE: all four component properties in one conversion, range selection and coefficient pass
+  const props = buildComponentPropsByNameMulti({
     components,
     component_key,
     hsgs,
     temperature,
-    prop_name: 'heat_capacity'
+    prop_names: ['enthalpy', 'entropy', 'gibbs', 'heat_capacity'] as const
   });
+  const H_i_IG = props?.enthalpy ?? null;
+  const S_i_IG = props?.entropy ?? null;
+  const G_i_IG = props?.gibbs ?? null;
+  const Cp_i_IG = props?.heat_capacity ?? null;
 
   const MW = MW_i ?? buildMWByName({ components, component_key, source, nasa_type, temperature }) ?? {};
 
@@ -1080,13 +1494,7 @@ export function dG_rxn_STD(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const G_i_IG = hsgs.calc_components_hsg(temperature, 'gibbs', { reaction_ids: true });
-  if (!G_i_IG) return null;
-
-  return rxn_adapter.dG_rxn_std({ G_i_IG });
+  return calcReactionProp(opts, 'dG_rxn_STD');
 }
 
 /**
@@ -1106,12 +1514,7 @@ export function dG_rxn_STD_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: dG_rxn_STD({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'dG_rxn_STD');
 }
 
 /**
@@ -1131,13 +1534,7 @@ export function dS_rxn_STD(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const S_i_IG = hsgs.calc_components_hsg(temperature, 'entropy', { reaction_ids: true });
-  if (!S_i_IG) return null;
-
-  return rxn_adapter.dS_rxn_std({ S_i_IG });
+  return calcReactionProp(opts, 'dS_rxn_STD');
 }
 
 /**
@@ -1157,12 +1554,7 @@ export function dS_rxn_STD_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: dS_rxn_STD({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'dS_rxn_STD');
 }
 
 /**
@@ -1182,13 +1574,7 @@ export function dH_rxn_STD(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const H_i_IG = hsgs.calc_components_hsg(temperature, 'enthalpy', { reaction_ids: true });
-  if (!H_i_IG) return null;
-
-  return rxn_adapter.dH_rxn_std({ H_i_IG });
+  return calcReactionProp(opts, 'dH_rxn_STD');
 }
 
 /**
@@ -1208,12 +1594,7 @@ export function dH_rxn_STD_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: dH_rxn_STD({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'dH_rxn_STD');
 }
 
 /**
@@ -1233,13 +1614,7 @@ export function dCp_rxn_STD(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const Cp_i_IG = hsgs.calc_components_hsg(temperature, 'heat_capacity', { reaction_ids: true });
-  if (!Cp_i_IG) return null;
-
-  return rxn_adapter.dCp_rxn_std({ Cp_i_IG });
+  return calcReactionProp(opts, 'dCp_rxn_STD');
 }
 
 /**
@@ -1259,12 +1634,7 @@ export function dCp_rxn_STD_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: dCp_rxn_STD({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'dCp_rxn_STD');
 }
 
 /**
@@ -1336,16 +1706,7 @@ export function Keq(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const G_i_IG = hsgs.calc_components_hsg(temperature, 'gibbs', { reaction_ids: true });
-  if (!G_i_IG) return null;
-
-  const dG = rxn_adapter.dG_rxn_std({ G_i_IG });
-  if (!dG) return null;
-
-  return rxn_adapter.Keq({ dG_rxn_STD: dG, temperature });
+  return calcReactionProp(opts, 'Keq');
 }
 
 /**
@@ -1365,12 +1726,63 @@ export function Keq_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
+  return calcReactionPropSeries(opts, 'Keq');
+}
 
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: Keq({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+/**
+ * SECTION: Calculate standard Gibbs free energy of reaction over an array of Kelvin temperatures
+ * @param opts - Options object
+ * @param opts.reaction - The reaction to calculate for
+ * @param opts.temperatures_K - Temperatures in Kelvin (number[] or Float64Array)
+ * @param opts.model_source - The NASA model source data
+ * @param opts.component_key - Component identifier key (default: 'Name-Formula')
+ * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
+ * @returns CustomPropArray | null - ΔG°rxn values aligned with temperatures_K (NaN where a temperature is invalid or has no data), or null if the reaction's components have no data
+ */
+export function dG_rxn_STD_batch(opts: {
+  reaction: Reaction;
+  temperatures_K: ArrayLike<number>;
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+}): CustomPropArray | null {
+  const { reaction, temperatures_K, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
+
+  const ctx = buildReactionContext({ reaction, model_source, component_key, nasa_type });
+  const dG = calcReactionGibbsBatch(ctx, temperatures_K, nasa_type);
+  if (!dG) return null;
+
+  return { values: dG, unit: 'J/mol', basis: 'molar' };
+}
+
+/**
+ * SECTION: Calculate equilibrium constant curve over an array of Kelvin temperatures
+ * @param opts - Options object
+ * @param opts.reaction - The reaction to calculate for
+ * @param opts.temperatures_K - Temperatures in Kelvin (number[] or Float64Array)
+ * @param opts.model_source - The NASA model source data
+ * @param opts.component_key - Component identifier key (default: 'Name-Formula')
+ * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
+ * @returns CustomPropArray | null - Keq values aligned with temperatures_K (NaN where a temperature is invalid or has no data), or null if the reaction's components have no data
+ */
+export function Keq_curve(opts: {
+  reaction: Reaction;
+  temperatures_K: ArrayLike<number>;
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+}): CustomPropArray | null {
+  const { reaction, temperatures_K, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
+
+  const ctx = buildReactionContext({ reaction, model_source, component_key, nasa_type });
+  const dG = calcReactionGibbsBatch(ctx, temperatures_K, nasa_type);
+  if (!dG) return null;
+
+  // NOTE: Keq = exp(-ΔG°rxn / (R T)), in place over the ΔG array
+  for (let i = 0; i < dG.length; i++) {
+    dG[i] = Math.exp(-dG[i] / (R_CONST_J__molK * temperatures_K[i]));
+  }
+  return { values: dG, unit: 'dimensionless', basis: 'molar' };
 }
 
 /**
@@ -1390,29 +1802,61 @@ export function Keq_vh_shortcut(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const standard_temperature: Temperature = { value: 298.15, unit: 'K' };
-
-  const H_i_STD = hsgs.calc_components_hsg(standard_temperature, 'enthalpy', { reaction_ids: true });
-  if (!H_i_STD) return null;
-  const dH_std = rxn_adapter.dH_rxn_std({ H_i_IG: H_i_STD });
-  if (!dH_std) return null;
-
-  const G_i_STD = hsgs.calc_components_hsg(standard_temperature, 'gibbs', { reaction_ids: true });
-  if (!G_i_STD) return null;
-  const dG_std = rxn_adapter.dG_rxn_std({ G_i_IG: G_i_STD });
-  if (!dG_std) return null;
+  return calcReactionProp(opts, 'Keq_vh_shortcut');
+}
 
-  const Keq_STD = rxn_adapter.Keq({ dG_rxn_STD: dG_std, temperature: standard_temperature });
-  if (!Keq_STD) return null;
+/**
+ * SECTION: Calculate Van't Hoff shortcut equilibrium constant over a temperature list
+ * @param opts - Options object
+ * @param opts.reaction - The reaction to calculate for
+ * @param opts.temperature_list - Temperatures to evaluate
+ * @param opts.model_source - The NASA model source data
+ * @param opts.component_key - Component identifier key (default: 'Name-Formula')
+ * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
+ * @returns Array<{ temperature: Temperature; result: CustomProp | null }>
+ */
+export function Keq_vh_shortcut_series(opts: {
+  reaction: Reaction;
+  temperature_list: Temperature[];
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+}): Array<{ temperature: Temperature; result: CustomProp | null }> {
+  return calcReactionPropSeries(opts, 'Keq_vh_shortcut');
+}
 
-  return rxn_adapter.Keq_vh_shortcut({
-    Keq_STD,
-    dH_rxn_STD: dH_std,
-    temperature
-  });
+/**
+ * SECTION: Calculate Van't Hoff shortcut equilibrium constant curve over an array of Kelvin temperatures
+ * @param opts - Options object
+ * @param opts.reaction - The reaction to calculate for
+ * @param opts.temperatures_K - Temperatures in Kelvin (number[] or Float64Array)
+ * @param opts.model_source - The NASA model source data
+ * @param opts.component_key - Component identifier key (default: 'Name-Formula')
+ * @param opts.nasa_type - NASA data type to use, 'nasa7' or 'nasa9' (default: 'nasa9')
+ * @returns CustomPropArray | null - Keq values aligned with temperatures_K (NaN where a temperature is invalid), or null if the standard state cannot be evaluated
+ */
+export function Keq_vh_shortcut_curve(opts: {
+  reaction: Reaction;
+  temperatures_K: ArrayLike<number>;
+  model_source: ModelSource;
+  component_key?: ComponentKey;
+  nasa_type?: NASAType;
+}): CustomPropArray | null {
+  const { reaction, temperatures_K, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
+
+  const ctx = buildReactionContext({ reaction, model_source, component_key, nasa_type });
+  const std = calcReactionStandardState(ctx);
+  if (!std) return null;
+
+  // NOTE: Keq = Keq_STD * exp((-ΔH°rxn / R) * (1/T - 1/T_ref)), with ΔH°rxn and Keq_STD fixed at T_ref
+  const Keq_STD = std.Keq_STD.value;
+  const slope = -ensureEnergy(std.dH_std).value / R_CONST_J__molK;
+  const values = new Float64Array(temperatures_K.length);
+  for (let i = 0; i < values.length; i++) {
+    const T = temperatures_K[i];
+    values[i] = Number.isFinite(T) && T > 0 ? Keq_STD * Math.exp(slope * (1 / T - 1 / TEMPERATURE_REF_K)) : NaN;
+  }
+  return { values, unit: 'dimensionless', basis: 'molar' };
 }
 
 /**
@@ -1432,16 +1876,7 @@ export function dlnKeq_dT(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const H_i_IG = hsgs.calc_components_hsg(temperature, 'enthalpy', { reaction_ids: true });
-  if (!H_i_IG) return null;
-
-  const dH = rxn_adapter.dH_rxn_std({ H_i_IG });
-  if (!dH) return null;
-
-  return rxn_adapter.dlnKeq_dT({ dH_rxn_STD: dH, temperature });
+  return calcReactionProp(opts, 'dlnKeq_dT');
 }
 
 /**
@@ -1461,12 +1896,7 @@ export function dlnKeq_dT_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: dlnKeq_dT({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'dlnKeq_dT');
 }
 
 /**
@@ -1486,16 +1916,7 @@ export function dG_rxn_dT(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const S_i_IG = hsgs.calc_components_hsg(temperature, 'entropy', { reaction_ids: true });
-  if (!S_i_IG) return null;
-
-  const dS = rxn_adapter.dS_rxn_std({ S_i_IG });
-  if (!dS) return null;
-
-  return rxn_adapter.dG_rxn_dT({ dS_rxn_STD: dS });
+  return calcReactionProp(opts, 'dG_rxn_dT');
 }
 
 /**
@@ -1515,12 +1936,7 @@ export function dG_rxn_dT_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: dG_rxn_dT({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'dG_rxn_dT');
 }
 
 /**
@@ -1540,16 +1956,7 @@ export function dlnK_dInvT(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const H_i_IG = hsgs.calc_components_hsg(temperature, 'enthalpy', { reaction_ids: true });
-  if (!H_i_IG) return null;
-
-  const dH = rxn_adapter.dH_rxn_std({ H_i_IG });
-  if (!dH) return null;
-
-  return rxn_adapter.dlnK_dInvT({ dH_rxn_STD: dH });
+  return calcReactionProp(opts, 'dlnK_dInvT');
 }
 
 /**
@@ -1569,12 +1976,7 @@ export function dlnK_dInvT_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: dlnK_dInvT({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'dlnK_dInvT');
 }
 
 /**
@@ -1594,10 +1996,7 @@ export function dlnK_dH(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  return rxn_adapter.dlnK_dH({ temperature });
+  return calcReactionProp(opts, 'dlnK_dH');
 }
 
 /**
@@ -1617,16 +2016,7 @@ export function dH_rxn_dT(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const Cp_i_IG = hsgs.calc_components_hsg(temperature, 'heat_capacity', { reaction_ids: true });
-  if (!Cp_i_IG) return null;
-
-  const dCp = rxn_adapter.dCp_rxn_std({ Cp_i_IG });
-  if (!dCp) return null;
-
-  return rxn_adapter.dH_rxn_dT({ dCp_rxn_STD: dCp });
+  return calcReactionProp(opts, 'dH_rxn_dT');
 }
 
 /**
@@ -1646,16 +2036,7 @@ export function dS_rxn_dT(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-  const Cp_i_IG = hsgs.calc_components_hsg(temperature, 'heat_capacity', { reaction_ids: true });
-  if (!Cp_i_IG) return null;
-
-  const dCp = rxn_adapter.dCp_rxn_std({ Cp_i_IG });
-  if (!dCp) return null;
-
-  return rxn_adapter.dS_rxn_dT({ dCp_rxn_STD: dCp, temperature });
+  return calcReactionProp(opts, 'dS_rxn_dT');
 }
 
 /**
@@ -1675,21 +2056,7 @@ export function d2lnK_dT2(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): CustomProp | null {
-  const { reaction, temperature, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
-
-  const H_i_IG = hsgs.calc_components_hsg(temperature, 'enthalpy', { reaction_ids: true });
-  if (!H_i_IG) return null;
-  const dH = rxn_adapter.dH_rxn_std({ H_i_IG });
-  if (!dH) return null;
-
-  const Cp_i_IG = hsgs.calc_components_hsg(temperature, 'heat_capacity', { reaction_ids: true });
-  if (!Cp_i_IG) return null;
-  const dCp = rxn_adapter.dCp_rxn_std({ Cp_i_IG });
-  if (!dCp) return null;
-
-  return rxn_adapter.d2lnK_dT2({ dH_rxn_STD: dH, dCp_rxn_STD: dCp, temperature });
+  return calcReactionProp(opts, 'd2lnK_dT2');
 }
 
 /**
@@ -1709,12 +2076,7 @@ export function dlnK_dH_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: dlnK_dH({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'dlnK_dH');
 }
 
 /**
@@ -1734,12 +2096,7 @@ export function dH_rxn_dT_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: dH_rxn_dT({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'dH_rxn_dT');
 }
 
 /**
@@ -1759,12 +2116,7 @@ export function dS_rxn_dT_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: dS_rxn_dT({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'dS_rxn_dT');
 }
 
 /**
@@ -1784,12 +2136,7 @@ export function d2lnK_dT2_series(opts: {
   component_key?: ComponentKey;
   nasa_type?: NASAType;
 }): Array<{ temperature: Temperature; result: CustomProp | null }> {
-  const { reaction, temperature_list, model_source, component_key = 'Name-Formula', nasa_type = 'nasa9' } = opts;
-
-  return temperature_list.map((temperature) => ({
-    temperature,
-    result: d2lnK_dT2({ reaction, temperature, model_source, component_key, nasa_type })
-  }));
+  return calcReactionPropSeries(opts, 'd2lnK_dT2');
 }
 
 /**
@@ -1823,13 +2170,11 @@ export function equilibrium_temperature(opts: {
     options
   } = opts;
 
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
+  const ctx = buildReactionContext({ reaction, model_source, component_key, nasa_type });
+  const { rxn_adapter } = ctx;
 
-  const dG_rxn_STD_func = (temperature: Temperature): CustomProp | null => {
-    const G_i_IG = hsgs.calc_components_hsg(temperature, 'gibbs', { reaction_ids: true });
-    if (!G_i_IG) return null;
-    return rxn_adapter.dG_rxn_std({ G_i_IG });
-  };
+  // NOTE: solver callback on the component-vector path (no per-iteration record or unit checks)
+  const dG_rxn_STD_func = (temperature: Temperature): CustomProp | null => calcReactionStd(ctx, temperature, 'gibbs');
 
   return rxn_adapter.equilibrium_temperature({
     Keq_target,
@@ -1867,13 +2212,11 @@ export function equilibrium_temperature_K1(opts: {
     options
   } = opts;
 
-  const { rxn_adapter, hsgs } = buildReactionContext({ reaction, model_source, component_key, nasa_type });
+  const ctx = buildReactionContext({ reaction, model_source, component_key, nasa_type });
+  const { rxn_adapter } = ctx;
 
-  const dG_rxn_STD_func = (temperature: Temperature): CustomProp | null => {
-    const G_i_IG = hsgs.calc_components_hsg(temperature, 'gibbs', { reaction_ids: true });
-    if (!G_i_IG) return null;
-    return rxn_adapter.dG_rxn_std({ G_i_IG });
-  };
+  // NOTE: solver callback on the component-vector path (no per-iteration record or unit checks)
+  const dG_rxn_STD_func = (temperature: Temperature): CustomProp | null => calcReactionStd(ctx, temperature, 'gibbs');
 
   return rxn_adapter.equilibrium_temperature_K1({
     dG_rxn_STD_func,
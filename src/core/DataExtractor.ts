@@ -12,12 +12,14 @@ export class DataExtractor {
     component: Component;
     component_key: ComponentKey;
     prop_name: string;
+    component_id?: string;
   }): ComponentEquationSource | null {
     return (
       this.source.getDataSource({
         component: opts.component,
         componentKey: opts.component_key,
-        propName: opts.prop_name as any
+        propName: opts.prop_name as any,
+        componentId: opts.component_id
       }) ?? null
     );
   }
@@ -1,42 +1,74 @@
 import { DataExtractor } from './DataExtractor';
 import {
-  En_IG_NASA9_polynomial,
-  En_IG_NASA9_polynomial_ranges,
-  En_IG_NASA7_polynomial,
-  En_IG_NASA7_polynomial_ranges
-} from '@/thermo/enthalpy';
-import {
-  S_IG_NASA9_polynomial,
-  S_IG_NASA9_polynomial_ranges,
-  S_IG_NASA7_polynomial,
-  S_IG_NASA7_polynomial_ranges
-} from '@/thermo/entropy';
-import { GiFrEn_IG, GiFrEn_IG_ranges } from '@/thermo/gibbs';
-import { Cp_IG_NASA9_polynomial, Cp_IG_NASA7_polynomial } from '@/thermo/heatCapacity';
-import { requireCoeffs, toMassBasis } from '@/utils/tools';
+  En_IG_NASA9_kernel,
+  En_IG_NASA7_kernel,
+  S_IG_NASA9_kernel,
+  S_IG_NASA7_kernel,
+  GiFrEn_IG_NASA9_kernel,
+  GiFrEn_IG_NASA7_kernel,
+  Cp_IG_NASA9_kernel,
+  Cp_IG_NASA7_kernel,
+  HSCp_IG_NASA9_kernel,
+  HSCp_IG_NASA7_kernel,
+  NASAKernel,
+  NASASpecializedKernel,
+  specializeKernel
+} from '@/thermo/kernels';
+import { NASA_RANGES, nasaRangeIndex, pickCoeffs, pickCoeffsVector, toMassBasis, toMassBasisBatch } from '@/utils/tools';
+import { toKelvin } from '@/utils/unitConverter';
 import { setComponentId } from '@/utils/component';
 import { BasisType, ComponentKey, NASARangeType, NASAType } from '@/types/constants';
 import { ComponentEquationSource, Source, TemperatureRangeData } from '@/types/external';
-import { Component, CustomProp, Temperature } from '@/types/models';
+import { Component, CustomProp, CustomPropArray, Temperature } from '@/types/models';
 
 const REQ_COEFFS_NASA7 = ['a1', 'a2', 'a3', 'a4', 'a5', 'a6', 'a7'] as const;
 const REQ_COEFFS_NASA9 = ['a1', 'a2', 'a3', 'a4', 'a5', 'a6', 'a7', 'b1', 'b2'] as const;
 const REQ_PROPS = ['MW'] as const;
 
+// NOTE: output buffer for the fused HSCp kernels (read back immediately, so one buffer serves every call)
+const HSCP_SCRATCH = new Float64Array(3);
+
+// NOTE: HSG attribute, required coefficient keys and polynomial variant per NASA range
+type NASACoefficientsAttr =
+  | 'nasa9_200_1000_coefficients'
+  | 'nasa9_1000_6000_coefficients'
+  | 'nasa9_6000_20000_coefficients'
+  | 'nasa7_200_1000_coefficients'
+  | 'nasa7_1000_6000_coefficients'
+  | 'nasa7_6000_20000_coefficients';
+
+const NASA_DISPATCH: Readonly<
+  Record<NASARangeType, { attr: NASACoefficientsAttr; required: readonly string[]; variant: NASAType }>
+> = Object.freeze({
+  nasa9_200_1000_K: { attr: 'nasa9_200_1000_coefficients', required: REQ_COEFFS_NASA9, variant: 'nasa9' },
+  nasa9_1000_6000_K: { attr: 'nasa9_1000_6000_coefficients', required: REQ_COEFFS_NASA9, variant: 'nasa9' },
+  nasa9_6000_20000_K: { attr: 'nasa9_6000_20000_coefficients', required: REQ_COEFFS_NASA9, variant: 'nasa9' },
+  nasa7_200_1000_K: { attr: 'nasa7_200_1000_coefficients', required: REQ_COEFFS_NASA7, variant: 'nasa7' },
+  nasa7_1000_6000_K: { attr: 'nasa7_1000_6000_coefficients', required: REQ_COEFFS_NASA7, variant: 'nasa7' },
+  nasa7_6000_20000_K: { attr: 'nasa7_6000_20000_coefficients', required: REQ_COEFFS_NASA7, variant: 'nasa7' }
+});
+
+// NOTE: validated coefficients for a NASA range, positional (REQ_COEFFS order)
+// specialized holds the per-range closures built by specializeKernel, keyed by generic kernel
+// mass_mw is the MW used for mass-basis results, resolved once at build (null when results stay molar)
+type NASAPack = {
+  coeffs: Float64Array;
+  variant: NASAType;
+  mass_mw: number | null;
+  specialized: Map<NASAKernel, NASASpecializedKernel>;
+};
+
 export class HSG extends DataExtractor {
   componentId: string;
-  basis: BasisType;
+  readonly basis: BasisType;
   component: Component;
   component_key: ComponentKey;
 
-  nasa9_200_1000_coefficients?: TemperatureRangeData | null;
-  nasa9_1000_6000_coefficients?: TemperatureRangeData | null;
-  nasa9_6000_20000_coefficients?: TemperatureRangeData | null;
-  nasa7_200_1000_coefficients?: TemperatureRangeData | null;
-  nasa7_1000_6000_coefficients?: TemperatureRangeData | null;
-  nasa7_6000_20000_coefficients?: TemperatureRangeData | null;
-
-  private _props?: Record<string, number> | null;
+  // NOTE: undefined until the first range is read; initialised here so every instance gets the same field layout
+  private _props: Record<string, number> | null | undefined = undefined;
+  private readonly nasa_type: NASAType;
+  private readonly _nasa_coefficients = new Map<NASARangeType, TemperatureRangeData | null>();
+  private readonly _nasa_packs = new Map<NASARangeType, NASAPack | null>();
 
   // NOTE: constructor
   constructor(opts: {
@@ -50,25 +82,37 @@ export class HSG extends DataExtractor {
     this.component = opts.component;
     this.component_key = opts.component_key;
     this.basis = opts.basis ?? 'molar';
+    this.nasa_type = opts.nasa_type;
 
     this.componentId = setComponentId({
       component: this.component,
       componentKey: this.component_key
     });
+  }
 
-    // Extract NASA9 coefficients if specified
-    if (opts.nasa_type === 'nasa9') {
-      this.nasa9_200_1000_coefficients = this._extract_nasa_coefficients('nasa9_200_1000_K');
-      this.nasa9_1000_6000_coefficients = this._extract_nasa_coefficients('nasa9_1000_6000_K');
-      this.nasa9_6000_20000_coefficients = this._extract_nasa_coefficients('nasa9_6000_20000_K');
-    }
+  // NOTE: NASA coefficients are extracted from the source on first access (only for the selected NASA type)
+  get nasa9_200_1000_coefficients(): TemperatureRangeData | null | undefined {
+    return this._get_nasa_coefficients_data('nasa9_200_1000_K');
+  }
 
-    // Extract NASA7 coefficients if specified
-    if (opts.nasa_type === 'nasa7') {
-      this.nasa7_200_1000_coefficients = this._extract_nasa_coefficients('nasa7_200_1000_K');
-      this.nasa7_1000_6000_coefficients = this._extract_nasa_coefficients('nasa7_1000_6000_K');
-      this.nasa7_6000_20000_coefficients = this._extract_nasa_coefficients('nasa7_6000_20000_K');
-    }
+  get nasa9_1000_6000_coefficients(): TemperatureRangeData | null | undefined {
+    return this._get_nasa_coefficients_data('nasa9_1000_6000_K');
+  }
+
+  get nasa9_6000_20000_coefficients(): TemperatureRangeData | null | undefined {
+    return this._get_nasa_coefficients_data('nasa9_6000_20000_K');
+  }
+
+  get nasa7_200_1000_coefficients(): TemperatureRangeData | null | undefined {
+    return this._get_nasa_coefficients_data('nasa7_200_1000_K');
+  }
+
+  get nasa7_1000_6000_coefficients(): TemperatureRangeData | null | undefined {
+    return this._get_nasa_coefficients_data('nasa7_1000_6000_K');
+  }
+
+  get nasa7_6000_20000_coefficients(): TemperatureRangeData | null | undefined {
+    return this._get_nasa_coefficients_data('nasa7_6000_20000_K');
   }
 
   get props(): Record<string, number> | null | undefined {
@@ -79,11 +123,23 @@ export class HSG extends DataExtractor {
     this._props = value;
   }
 
+  private _get_nasa_coefficients_data(nasa_type: NASARangeType): TemperatureRangeData | null | undefined {
+    if (NASA_DISPATCH[nasa_type].variant !== this.nasa_type) return undefined;
+
+    let coeffs = this._nasa_coefficients.get(nasa_type);
+    if (coeffs === undefined) {
+      coeffs = this._extract_nasa_coefficients(nasa_type);
+      this._nasa_coefficients.set(nasa_type, coeffs);
+    }
+    return coeffs;
+  }
+
   private _extract_nasa_coefficients(prop_name: NASARangeType): TemperatureRangeData | null {
     const eq_src: ComponentEquationSource | null = this._get_equation_source({
       component: this.component,
       component_key: this.component_key,
-      prop_name
+      prop_name,
+      component_id: this.componentId
     });
     if (!eq_src) {
       return null;
@@ -92,161 +148,216 @@ export class HSG extends DataExtractor {
   }
 
   private _set_props(coeffs: TemperatureRangeData): Record<string, number> | null {
-    try {
-      return requireCoeffs(coeffs, REQ_PROPS);
-    } catch {
+    return pickCoeffs(coeffs, REQ_PROPS);
+  }
+
+  private _build_nasa_pack(nasa_type: NASARangeType): NASAPack | null {
+    const dispatch = NASA_DISPATCH[nasa_type];
+    if (!dispatch) return null;
+
+    const coeffs = this[dispatch.attr];
+
+    // NOTE: missing coefficients return null without throwing
+    const vector = coeffs ? pickCoeffsVector(coeffs, dispatch.required) : null;
+    if (!coeffs || !vector) {
       return null;
     }
+
+    // NOTE: MW is a component constant; props is recorded once from the first range read
+    const props = this._set_props(coeffs);
+    if (this._props === undefined) this._props = props;
+    const mass_mw = this.basis === 'mass' && props ? props.MW : null;
+    return { coeffs: vector, variant: dispatch.variant, mass_mw, specialized: new Map() };
   }
 
-  // NOTE: set NASA coefficients
-  private _set_nasa_coefficients(nasa_type: NASARangeType): Record<string, number> | null {
-    let coeffs: TemperatureRangeData | null | undefined;
-    let pack: Record<string, number> | null = null;
-
-    try {
-      switch (nasa_type) {
-        case 'nasa9_200_1000_K':
-          coeffs = this.nasa9_200_1000_coefficients;
-          pack = coeffs ? requireCoeffs(coeffs, REQ_COEFFS_NASA9) : null;
-          break;
-        case 'nasa9_1000_6000_K':
-          coeffs = this.nasa9_1000_6000_coefficients;
-          pack = coeffs ? requireCoeffs(coeffs, REQ_COEFFS_NASA9) : null;
-          break;
-        case 'nasa9_6000_20000_K':
-          coeffs = this.nasa9_6000_20000_coefficients;
-          pack = coeffs ? requireCoeffs(coeffs, REQ_COEFFS_NASA9) : null;
-          break;
-        case 'nasa7_200_1000_K':
-          coeffs = this.nasa7_200_1000_coefficients;
-          pack = coeffs ? requireCoeffs(coeffs, REQ_COEFFS_NASA7) : null;
-          break;
-        case 'nasa7_1000_6000_K':
-          coeffs = this.nasa7_1000_6000_coefficients;
-          pack = coeffs ? requireCoeffs(coeffs, REQ_COEFFS_NASA7) : null;
-          break;
-        case 'nasa7_6000_20000_K':
-          coeffs = this.nasa7_6000_20000_coefficients;
-          pack = coeffs ? requireCoeffs(coeffs, REQ_COEFFS_NASA7) : null;
-          break;
-        default:
-          return null;
-      }
-
-      if (!coeffs || !pack) {
-        return null;
-      }
-
-      this.props = this._set_props(coeffs);
-      return pack;
-    } catch {
-      return null;
+  // NOTE: coefficients for a NASA range, validated and unpacked once per range (at most one entry per NASA range)
+  private _get_nasa_vector(nasa_type: NASARangeType): NASAPack | null {
+    let vec = this._nasa_packs.get(nasa_type);
+    if (vec === undefined) {
+      vec = this._build_nasa_pack(nasa_type);
+      this._nasa_packs.set(nasa_type, vec);
     }
+    return vec;
   }
 
-  // SECTION: Calculate absolute enthalpy
-  calc_absolute_enthalpy(temperature: Temperature, nasa_type: NASARangeType): CustomProp | null {
-    const pack = this._set_nasa_coefficients(nasa_type);
-    if (!pack) return null;
+  // NOTE: positional coefficient vector for a NASA range (null if unavailable)
+  get_nasa_coefficients(nasa_type: NASARangeType): Float64Array | null {
+    return this._get_nasa_vector(nasa_type)?.coeffs ?? null;
+  }
 
-    const isNASA9 = nasa_type.startsWith('nasa9');
-    const enthalpy = isNASA9
-      ? En_IG_NASA9_polynomial({ ...(pack as any), temperature })
-      : En_IG_NASA7_polynomial({ ...(pack as any), temperature });
+  // NOTE: evaluate a kernel at a single temperature for a NASA range
+  private _calc_kernel(
+    temperature: Temperature,
+    nasa_type: NASARangeType,
+    kernel_nasa9: NASAKernel,
+    kernel_nasa7: NASAKernel,
+    unit: string
+  ): CustomProp | null {
+    const vec = this._get_nasa_vector(nasa_type);
+    if (!vec) return null;
+
+    const T = toKelvin(temperature);
+    if (!Number.isFinite(T) || T <= 0) return null;
+
+    const fn = this._specialized(vec, vec.variant === 'nasa9' ? kernel_nasa9 : kernel_nasa7);
+    return this._to_basis({ value: fn(T), unit }, vec.mass_mw);
+  }
 
-    if (!enthalpy) return null;
-    if (this.basis === 'mass' && this.props && 'MW' in this.props) {
-      return toMassBasis(enthalpy, this.props.MW);
+  // NOTE: kernel specialized for a range pack on first use, then reused by scalar and sweep paths
+  private _specialized(vec: NASAPack, kernel: NASAKernel): NASASpecializedKernel {
+    let fn = vec.specialized.get(kernel);
+    if (!fn) {
+      fn = specializeKernel(kernel, vec.coeffs);
+      vec.specialized.set(kernel, fn);
     }
-    return enthalpy;
+    return fn;
   }
 
-  // SECTION: Calculate absolute entropy
-  calc_absolute_entropy(temperature: Temperature, nasa_type: NASARangeType): CustomProp | null {
-    const pack = this._set_nasa_coefficients(nasa_type);
-    if (!pack) return null;
+  // NOTE: basis and MW availability are already folded into mass_mw, so only one check remains per call
+  private _to_basis(prop: CustomProp, mass_mw: number | null): CustomProp {
+    return mass_mw === null ? prop : toMassBasis(prop, mass_mw);
+  }
 
-    const isNASA9 = nasa_type.startsWith('nasa9');
-    const entropy = isNASA9
-      ? S_IG_NASA9_polynomial({ ...(pack as any), temperature })
-      : S_IG_NASA7_polynomial({ ...(pack as any), temperature });
+  // SECTION: Calculate absolute enthalpy
+  calc_absolute_enthalpy(temperature: Temperature, nasa_type: NASARangeType): CustomProp | null {
+    return this._calc_kernel(temperature, nasa_type, En_IG_NASA9_kernel, En_IG_NASA7_kernel, 'J/mol');
+  }
 
-    if (!entropy) return null;
-    if (this.basis === 'mass' && this.props && 'MW' in this.props) {
-      return toMassBasis(entropy, this.props.MW);
-    }
-    return entropy;
+  // SECTION: Calculate absolute entropy
+  calc_absolute_entropy(temperature: Temperature, nasa_type: NASARangeType): CustomProp | null {
+    return this._calc_kernel(temperature, nasa_type, S_IG_NASA9_kernel, S_IG_NASA7_kernel, 'J/mol.K');
   }
 
   // SECTION: Calculate Gibbs free energy
   calc_gibbs_free_energy(temperature: Temperature, nasa_type: NASARangeType): CustomProp | null {
-    const pack = this._set_nasa_coefficients(nasa_type);
-    if (!pack) return null;
-
-    const method = nasa_type.includes('nasa9') ? 'NASA9' : 'NASA7';
-    const gibbs =
-      method === 'NASA9'
-        ? GiFrEn_IG({ method, ...(pack as any), temperature })
-        : GiFrEn_IG({ method, ...(pack as any), temperature });
-
-    if (!gibbs) return null;
-    if (this.basis === 'mass' && this.props && 'MW' in this.props) {
-      return toMassBasis(gibbs, this.props.MW);
-    }
-    return gibbs;
+    return this._calc_kernel(temperature, nasa_type, GiFrEn_IG_NASA9_kernel, GiFrEn_IG_NASA7_kernel, 'J/mol');
   }
 
   // SECTION: Calculate heat capacity
   calc_heat_capacity(temperature: Temperature, nasa_type: NASARangeType): CustomProp | null {
-    const pack = this._set_nasa_coefficients(nasa_type);
-    if (!pack) return null;
-
-    const isNASA9 = nasa_type.startsWith('nasa9');
-    const heatCapacity = isNASA9
-      ? Cp_IG_NASA9_polynomial({ ...(pack as any), temperature })
-      : Cp_IG_NASA7_polynomial({ ...(pack as any), temperature });
+    return this._calc_kernel(temperature, nasa_type, Cp_IG_NASA9_kernel, Cp_IG_NASA7_kernel, 'J/mol.K');
+  }
 
-    if (!heatCapacity) return null;
-    if (this.basis === 'mass' && this.props && 'MW' in this.props) {
-      return toMassBasis(heatCapacity, this.props.MW);
-    }
-    return heatCapacity;
+  // SECTION: Calculate enthalpy, entropy, Gibbs free energy and heat capacity in one coefficient pass
+  calc_all(
+    temperature: Temperature,
+    nasa_type: NASARangeType
+  ): { H: CustomProp; S: CustomProp; G: CustomProp; Cp: CustomProp } | null {
+    const vec = this._get_nasa_vector(nasa_type);
+    if (!vec) return null;
+
+    const T = toKelvin(temperature);
+    if (!Number.isFinite(T) || T <= 0) return null;
+
+    // NOTE: one fused kernel pass shares powers of T and log(T) across H, S and Cp
+    const kernel = vec.variant === 'nasa9' ? HSCp_IG_NASA9_kernel : HSCp_IG_NASA7_kernel;
+    const out = kernel(T, vec.coeffs, HSCP_SCRATCH);
+    const H = out[0];
+    const S = out[1];
+    const Cp = out[2];
+
+    // NOTE: G reuses the H and S already evaluated
+    return {
+      H: this._to_basis({ value: H, unit: 'J/mol' }, vec.mass_mw),
+      S: this._to_basis({ value: S, unit: 'J/mol.K' }, vec.mass_mw),
+      G: this._to_basis({ value: H - T * S, unit: 'J/mol' }, vec.mass_mw),
+      Cp: this._to_basis({ value: Cp, unit: 'J/mol.K' }, vec.mass_mw)
+    };
   }
 
   // SECTION: Calculate enthalpy range
-  calc_absolute_enthalpy_range(temperatures: Temperature[], nasa_type: NASARangeType) {
-    const pack = this._set_nasa_coefficients(nasa_type);
-    if (!pack) return null;
+  calc_absolute_enthalpy_range(temperatures: Temperature[], nasa_type: NASARangeType): CustomProp[] | null {
+    return this._calc_kernel_range(temperatures, nasa_type, En_IG_NASA9_kernel, En_IG_NASA7_kernel, 'J/mol');
+  }
 
-    const isNASA9 = nasa_type.startsWith('nasa9');
-    const enthalpyRange = isNASA9
-      ? En_IG_NASA9_polynomial_ranges({ ...(pack as any), temperatures })
-      : En_IG_NASA7_polynomial_ranges({ ...(pack as any), temperatures });
+  // SECTION: Calculate entropy range
+  calc_absolute_entropy_range(temperatures: Temperature[], nasa_type: NASARangeType): CustomProp[] | null {
+    return this._calc_kernel_range(temperatures, nasa_type, S_IG_NASA9_kernel, S_IG_NASA7_kernel, 'J/mol.K');
+  }
 
-    return enthalpyRange ?? null;
+  // SECTION: Calculate Gibbs free energy range
+  calc_gibbs_free_energy_range(temperatures: Temperature[], nasa_type: NASARangeType): CustomProp[] | null {
+    return this._calc_kernel_range(temperatures, nasa_type, GiFrEn_IG_NASA9_kernel, GiFrEn_IG_NASA7_kernel, 'J/mol');
   }
 
-  // SECTION: Calculate entropy range
-  calc_absolute_entropy_range(temperatures: Temperature[], nasa_type: NASARangeType) {
-    const pack = this._set_nasa_coefficients(nasa_type);
-    if (!pack) return null;
+  // NOTE: evaluate a kernel over a temperature list for one NASA range in a single loop
+  // invalid temperatures yield 0 and an all-invalid list yields null, as in the thermo *_ranges helpers
+  private _calc_kernel_range(
+    temperatures: Temperature[],
+    nasa_type: NASARangeType,
+    kernel_nasa9: NASAKernel,
+    kernel_nasa7: NASAKernel,
+    unit: string
+  ): CustomProp[] | null {
+    const vec = this._get_nasa_vector(nasa_type);
+    if (!vec) return null;
+
+    // NOTE: convert once to Kelvin; invalid temperatures are marked NaN
+    const temperatures_K = new Float64Array(temperatures.length);
+    let found = false;
+    for (let i = 0; i < temperatures.length; i++) {
+      const T = toKelvin(temperatures[i]);
+      const valid = Number.isFinite(T) && T > 0;
+      temperatures_K[i] = valid ? T : NaN;
+      found ||= valid;
+    }
+    if (!found) return null;
 
-    const isNASA9 = nasa_type.startsWith('nasa9');
-    const entropyRange = isNASA9
-      ? S_IG_NASA9_polynomial_ranges({ ...(pack as any), temperatures })
-      : S_IG_NASA7_polynomial_ranges({ ...(pack as any), temperatures });
+    const fn = this._specialized(vec, vec.variant === 'nasa9' ? kernel_nasa9 : kernel_nasa7);
+    const res: CustomProp[] = new Array(temperatures_K.length);
+    for (let i = 0; i < temperatures_K.length; i++) {
+      const value = fn(temperatures_K[i]);
+      res[i] = { value: Number.isNaN(value) ? 0 : value, unit };
+    }
+    return res;
+  }
 
-    return entropyRange ?? null;
+  // SECTION: Calculate absolute enthalpy over temperatures in Kelvin
+  calc_absolute_enthalpy_vec(temperatures_K: ArrayLike<number>): CustomPropArray | null {
+    return this._calc_vec(temperatures_K, En_IG_NASA9_kernel, En_IG_NASA7_kernel, 'J/mol');
   }
 
-  // SECTION: Calculate Gibbs free energy range
-  calc_gibbs_free_energy_range(temperatures: Temperature[], nasa_type: NASARangeType) {
-    const pack = this._set_nasa_coefficients(nasa_type);
-    if (!pack) return null;
+  // SECTION: Calculate absolute entropy over temperatures in Kelvin
+  calc_absolute_entropy_vec(temperatures_K: ArrayLike<number>): CustomPropArray | null {
+    return this._calc_vec(temperatures_K, S_IG_NASA9_kernel, S_IG_NASA7_kernel, 'J/mol.K');
+  }
 
-    const method = nasa_type.includes('nasa9') ? 'NASA9' : 'NASA7';
-    const gibbsRange = GiFrEn_IG_ranges({ method, ...(pack as any), temperatures });
-    return gibbsRange ?? null;
+  // SECTION: Calculate Gibbs free energy over temperatures in Kelvin
+  calc_gibbs_free_energy_vec(temperatures_K: ArrayLike<number>): CustomPropArray | null {
+    return this._calc_vec(temperatures_K, GiFrEn_IG_NASA9_kernel, GiFrEn_IG_NASA7_kernel, 'J/mol');
+  }
+
+  // SECTION: Calculate heat capacity over temperatures in Kelvin
+  calc_heat_capacity_vec(temperatures_K: ArrayLike<number>): CustomPropArray | null {
+    return this._calc_vec(temperatures_K, Cp_IG_NASA9_kernel, Cp_IG_NASA7_kernel, 'J/mol.K');
+  }
+
+  // NOTE: evaluate a kernel over Kelvin temperatures, selecting the NASA range per temperature
+  private _calc_vec(
+    temperatures_K: ArrayLike<number>,
+    kernel_nasa9: NASAKernel,
+    kernel_nasa7: NASAKernel,
+    unit: string
+  ): CustomPropArray | null {
+    const kernel = this.nasa_type === 'nasa9' ? kernel_nasa9 : kernel_nasa7;
+
+    // NOTE: specialized kernels for the low/mid/high ranges
+    const packs = NASA_RANGES[this.nasa_type].map((range) => this._get_nasa_vector(range));
+    const available = packs.find((pack) => pack !== null);
+    if (!available) return null;
+    const fns = packs.map((pack) => (pack ? this._specialized(pack, kernel) : null));
+
+    const values = new Float64Array(temperatures_K.length);
+    for (let i = 0; i < values.length; i++) {
+      const T = temperatures_K[i];
+      const fn = fns[nasaRangeIndex(T, this.nasa_type)];
+      values[i] = fn && Number.isFinite(T) && T > 0 ? fn(T) : NaN;
+    }
+
+    // NOTE: convert to mass basis in place, parsing the unit once
+    if (available.mass_mw !== null) {
+      return toMassBasisBatch(values, unit, available.mass_mw, values);
+    }
+    return { values, unit, basis: 'molar' };
   }
 }
@@ -1,28 +1,71 @@
 import { HSG } from './HSG';
-import {
-  NASARangeType,
-  NASAType,
-  ComponentKey,
-  TEMPERATURE_BREAK_NASA7_1000_K,
-  TEMPERATURE_BREAK_NASA7_6000_K,
-  TEMPERATURE_BREAK_NASA9_1000_K,
-  TEMPERATURE_BREAK_NASA9_6000_K
-} from '@/types/constants';
+import { NASARangeType, NASAType, ComponentKey } from '@/types/constants';
 import { Component, CustomProp, Temperature } from '@/types/models';
 import { Source } from '@/types/external';
-import { selectNasaType } from '@/utils/tools';
+import {
+  En_IG_NASA9_basis,
+  En_IG_NASA7_basis,
+  S_IG_NASA9_basis,
+  S_IG_NASA7_basis,
+  GiFrEn_IG_NASA9_basis,
+  GiFrEn_IG_NASA7_basis,
+  Cp_IG_NASA9_basis,
+  Cp_IG_NASA7_basis,
+  NASABasis,
+  evalBasisAll,
+  evalBasisMatrix
+} from '@/thermo/kernels';
+import { NASA_RANGES, nasaRangeIndex, selectNasaRangeK } from '@/utils/tools';
+import { toKelvin } from '@/utils/unitConverter';
 import { setComponentId } from '@/utils/component';
 
 // NOTE: PropName Type
 type PropName = 'enthalpy' | 'entropy' | 'gibbs' | 'heat_capacity';
 
+// NOTE: basis vectors and units per property
+const PROP_BASES: Readonly<Record<PropName, Readonly<{ nasa9: NASABasis; nasa7: NASABasis; unit: string }>>> = Object.freeze({
+  enthalpy: { nasa9: En_IG_NASA9_basis, nasa7: En_IG_NASA7_basis, unit: 'J/mol' },
+  entropy: { nasa9: S_IG_NASA9_basis, nasa7: S_IG_NASA7_basis, unit: 'J/mol.K' },
+  gibbs: { nasa9: GiFrEn_IG_NASA9_basis, nasa7: GiFrEn_IG_NASA7_basis, unit: 'J/mol' },
+  heat_capacity: { nasa9: Cp_IG_NASA9_basis, nasa7: Cp_IG_NASA7_basis, unit: 'J/mol.K' }
+});
+
+// NOTE: coefficients of all components with data in a NASA range, stored contiguously
+// matrix holds one row of `stride` coefficients per id; component_rows maps each constructor component
+// (by index) to its matrix row, -1 when it has no data in the range
+type RangeCoefficients = {
+  ids: string[];
+  reaction_ids: string[];
+  stride: number;
+  matrix: Float64Array;
+  component_rows: Int32Array;
+};
+
+// NOTE: property values tabulated on a Kelvin grid inside one NASA range
+// values is row-major (grid points x components), columns aligned with the range's RangeCoefficients
+type RangeTable = {
+  temperatures_K: Float64Array;
+  values: Float64Array;
+};
+
 export class HSGs {
   private readonly component_ids: string[];
-  private readonly reaction_component_ids: Record<string, string>;
-  private readonly nasa_temperature_break_min: Temperature;
-  private readonly nasa_temperature_break_max: Temperature;
+  // NOTE: reaction ids (Formula-State) aligned by index with component_ids
+  private readonly reaction_component_ids: string[];
+
+  // NOTE: HSG per component id, built on first access
+  private readonly hsg_cache = new Map<string, HSG>();
 
-  components_hsg: Record<string, HSG>;
+  private readonly range_coefficients = new Map<NASARangeType, RangeCoefficients>();
+
+  // NOTE: scratch basis vector reused by every single-temperature evaluation
+  private readonly basis_scratch: Float64Array;
+
+  // NOTE: basis builder per property for this instance's NASA type (unknown names miss the map)
+  private readonly prop_bases: ReadonlyMap<string, NASABasis>;
+
+  // NOTE: tables built by tabulate (components and NASA type are fixed per instance, so tables never go stale)
+  private readonly range_tables = new Map<PropName, Map<NASARangeType, RangeTable>>();
 
   // NOTE: Constructor
   constructor(
@@ -31,47 +74,98 @@ export class HSGs {
     private readonly component_key: ComponentKey,
     private readonly nasa_type: NASAType
   ) {
-    // ! Set component IDs
-    this.component_ids = components.map((component) =>
-      setComponentId({ component, componentKey: component_key })
-    );
-
-    // ! Set reaction component IDs
-    this.reaction_component_ids = {};
-    for (const [compId, component] of this.component_ids.map((id, idx) => [id, components[idx]] as const)) {
-      this.reaction_component_ids[compId] = `${component.formula}-${component.state}`;
+    // ! Set component and reaction (Formula-State) IDs in one pass, positionally aligned
+    const same_key = component_key === 'Formula-State';
+    this.component_ids = new Array<string>(components.length);
+    this.reaction_component_ids = new Array<string>(components.length);
+    for (let i = 0; i < components.length; i++) {
+      const component = components[i];
+      const id = setComponentId({ component, componentKey: component_key });
+      this.component_ids[i] = id;
+      this.reaction_component_ids[i] = same_key ? id : setComponentId({ component, componentKey: 'Formula-State' });
     }
 
-    // ! Set NASA temperature breaks
-    const nasa_temperature_break_min_value =
-      this.nasa_type === 'nasa7'
-        ? TEMPERATURE_BREAK_NASA7_1000_K
-        : TEMPERATURE_BREAK_NASA9_1000_K;
-    this.nasa_temperature_break_min = { value: nasa_temperature_break_min_value, unit: 'K' };
+    // ! Basis scratch sized for the NASA type
+    this.basis_scratch = new Float64Array(this.nasa_type === 'nasa9' ? 9 : 7);
 
-    // ! Set NASA temperature breaks
-    const nasa_temperature_break_max_value =
-      this.nasa_type === 'nasa7'
-        ? TEMPERATURE_BREAK_NASA7_6000_K
-        : TEMPERATURE_BREAK_NASA9_6000_K;
-    this.nasa_temperature_break_max = { value: nasa_temperature_break_max_value, unit: 'K' };
+    // ! Resolve basis builders for the NASA type once
+    this.prop_bases = new Map(
+      Object.entries(PROP_BASES).map(([prop_name, bases]) => [prop_name, bases[this.nasa_type]] as const)
+    );
 
-    // ! Build HSGs for components
-    this.components_hsg = this.build_components_hsg();
+    // NOTE: HSGs and packed ranges are built on first use (get_component_hsg / get_range_coefficients),
+    // so construction does no lookups and ranges a workload never reaches are never packed
+  }
+
+  // NOTE: HSGs for all components (builds any not yet accessed)
+  get components_hsg(): Record<string, HSG> {
+    return this.build_components_hsg();
   }
 
   // NOTE: Build HSGs for components
   build_components_hsg(): Record<string, HSG> {
     const hsgs: Record<string, HSG> = {};
-    for (const [id, component] of this.component_ids.map((id, idx) => [id, this.components[idx]] as const)) {
-      hsgs[id] = new HSG({
+    for (let i = 0; i < this.component_ids.length; i++) {
+      hsgs[this.component_ids[i]] = this.get_component_hsg(i);
+    }
+    return hsgs;
+  }
+
+  // NOTE: HSG for the component at a constructor index, built and memoised on first access
+  get_component_hsg(index: number): HSG {
+    const id = this.component_ids[index];
+    let hsg = this.hsg_cache.get(id);
+    if (!hsg) {
+      hsg = new HSG({
         source: this.source,
-        component,
+        component: this.components[index],
         component_key: this.component_key,
         nasa_type: this.nasa_type
       });
+      this.hsg_cache.set(id, hsg);
     }
-    return hsgs;
+    return hsg;
+  }
+
+  // NOTE: Pack component coefficients for a NASA range into one contiguous matrix
+  build_range_coefficients(nasa_type: NASARangeType): RangeCoefficients {
+    const ids: string[] = [];
+    const reaction_ids: string[] = [];
+    const vectors: Float64Array[] = [];
+    const rows = new Map<string, number>();
+    const component_rows = new Int32Array(this.component_ids.length).fill(-1);
+    for (let i = 0; i < this.component_ids.length; i++) {
+      // NOTE: one row per distinct component id, as in components_hsg
+      const id = this.component_ids[i];
+      const row = rows.get(id);
+      if (row !== undefined) {
+        component_rows[i] = row;
+        continue;
+      }
+
+      const coeffs = this.get_component_hsg(i).get_nasa_coefficients(nasa_type);
+      rows.set(id, coeffs ? ids.length : -1);
+      if (!coeffs) continue;
+      component_rows[i] = ids.length;
+      ids.push(id);
+      reaction_ids.push(this.reaction_component_ids[i]);
+      vectors.push(coeffs);
+    }
+
+    const stride = this.nasa_type === 'nasa9' ? 9 : 7;
+    const matrix = new Float64Array(ids.length * stride);
+    vectors.forEach((coeffs, i) => matrix.set(coeffs, i * stride));
+    return { ids, reaction_ids, stride, matrix, component_rows };
+  }
+
+  // NOTE: Packed coefficients for a NASA range
+  get_range_coefficients(nasa_type: NASARangeType): RangeCoefficients {
+    let packed = this.range_coefficients.get(nasa_type);
+    if (!packed) {
+      packed = this.build_range_coefficients(nasa_type);
+      this.range_coefficients.set(nasa_type, packed);
+    }
+    return packed;
   }
 
   // NOTE: Calculate properties for all components HSGs
@@ -80,42 +174,247 @@ export class HSGs {
     prop_name: PropName,
     opts?: { reaction_ids?: boolean }
   ): Record<string, CustomProp> | null {
-    const nasa_type_selected = selectNasaType(
-      temperature,
-      this.nasa_temperature_break_min,
-      this.nasa_temperature_break_max,
-      this.nasa_type
-    ) as NASARangeType;
-
-    const hsgs_data: Record<string, CustomProp> = {};
-    for (const [id, hsg] of Object.entries(this.components_hsg)) {
-      let res: CustomProp | null = null;
-      switch (prop_name) {
-        case 'enthalpy':
-          res = hsg.calc_absolute_enthalpy(temperature, nasa_type_selected);
-          break;
-        case 'entropy':
-          res = hsg.calc_absolute_entropy(temperature, nasa_type_selected);
-          break;
-        case 'gibbs':
-          res = hsg.calc_gibbs_free_energy(temperature, nasa_type_selected);
-          break;
-        case 'heat_capacity':
-          res = hsg.calc_heat_capacity(temperature, nasa_type_selected);
-          break;
+    return this.calc_components_hsg_multi(temperature, [prop_name], opts)?.[prop_name] ?? null;
+  }
+
+  // NOTE: Calculate several properties for all components HSGs in one range selection and coefficient pass
+  calc_components_hsg_multi<P extends PropName>(
+    temperature: Temperature,
+    prop_names: readonly P[],
+    opts?: { reaction_ids?: boolean }
+  ): Record<P, Record<string, CustomProp>> | null {
+    if (!prop_names.every((prop_name) => this.prop_bases.has(prop_name))) return null;
+
+    const T = toKelvin(temperature);
+    if (!Number.isFinite(T) || T <= 0) return null;
+    const nasa_type_selected = selectNasaRangeK(T, this.nasa_type);
+
+    const packed = this.get_range_coefficients(nasa_type_selected);
+    const { ids, reaction_ids } = packed;
+    if (!ids.length) return null;
+
+    // NOTE: output keys per component
+    const keys = opts?.reaction_ids ? reaction_ids : ids;
+
+    const res = {} as Record<P, Record<string, CustomProp>>;
+    for (const prop_name of prop_names) {
+      const { unit } = PROP_BASES[prop_name];
+      const values = this.eval_range_basis(packed, T, this.prop_bases.get(prop_name)!);
+
+      const hsgs_data: Record<string, CustomProp> = {};
+      for (let i = 0; i < keys.length; i++) {
+        hsgs_data[keys[i]] = { value: values[i], unit };
       }
+      res[prop_name] = hsgs_data;
+    }
+    return res;
+  }
 
-      if (!res) {
-        continue;
+  // NOTE: Calculate a property for all components as a vector aligned with reaction component ids
+  calc_components_hsg_vec(
+    temperature: Temperature,
+    prop_name: PropName
+  ): { reaction_ids: readonly string[]; values: Float64Array } | null {
+    const res = this.calc_components_hsg_vec_multi(temperature, [prop_name]);
+    return res ? { reaction_ids: res.reaction_ids, values: res.values[prop_name] } : null;
+  }
+
+  // NOTE: Calculate several properties as vectors aligned with reaction component ids,
+  // sharing one temperature conversion, range selection and packed-range lookup
+  calc_components_hsg_vec_multi<P extends PropName>(
+    temperature: Temperature,
+    prop_names: readonly P[]
+  ): { reaction_ids: readonly string[]; values: Record<P, Float64Array> } | null {
+    if (!prop_names.every((prop_name) => this.prop_bases.has(prop_name))) return null;
+
+    const T = toKelvin(temperature);
+    if (!Number.isFinite(T) || T <= 0) return null;
+    const nasa_type_selected = selectNasaRangeK(T, this.nasa_type);
+
+    const packed = this.get_range_coefficients(nasa_type_selected);
+    if (!packed.reaction_ids.length) return null;
+
+    const values = {} as Record<P, Float64Array>;
+    for (const prop_name of prop_names) {
+      values[prop_name] = this.eval_range_basis(packed, T, this.prop_bases.get(prop_name)!);
+    }
+    return { reaction_ids: packed.reaction_ids, values };
+  }
+
+  // NOTE: Calculate a property for the constructor's components in their order (NaN where a component has no data)
+  calc_components_hsg_ordered(
+    temperature: Temperature,
+    prop_name: PropName
+  ): { values: Float64Array; unit: string } | null {
+    return this.calc_components_hsg_ordered_multi(temperature, [prop_name])?.[prop_name] ?? null;
+  }
+
+  // NOTE: Calculate several properties in constructor component order with one conversion and range selection
+  calc_components_hsg_ordered_multi<P extends PropName>(
+    temperature: Temperature,
+    prop_names: readonly P[]
+  ): Record<P, { values: Float64Array; unit: string }> | null {
+    if (!prop_names.every((prop_name) => this.prop_bases.has(prop_name))) return null;
+
+    const T = toKelvin(temperature);
+    if (!Number.isFinite(T) || T <= 0) return null;
+    const nasa_type_selected = selectNasaRangeK(T, this.nasa_type);
+
+    const packed = this.get_range_coefficients(nasa_type_selected);
+    if (!packed.ids.length) return null;
+
+    const { component_rows } = packed;
+    const res = {} as Record<P, { values: Float64Array; unit: string }>;
+    for (const prop_name of prop_names) {
+      const packed_values = this.eval_range_basis(packed, T, this.prop_bases.get(prop_name)!);
+      const values = new Float64Array(component_rows.length);
+      for (let i = 0; i < component_rows.length; i++) {
+        const row = component_rows[i];
+        values[i] = row < 0 ? NaN : packed_values[row];
+      }
+      res[prop_name] = { values, unit: PROP_BASES[prop_name].unit };
+    }
+    return res;
+  }
+
+  // NOTE: evaluate a property for all packed components at one temperature (Kelvin)
+  // the basis vector is built once and applied to the coefficient matrix as a single matrix-vector product
+  private eval_range_basis(packed: RangeCoefficients, T: number, basis: NASABasis): Float64Array {
+    return evalBasisAll(basis(T, this.basis_scratch), packed.matrix, packed.stride);
+  }
+
+  // NOTE: Calculate a property for all components of a NASA range over Kelvin temperatures
+  // values is row-major (temperatures x components), columns aligned with reaction_ids;
+  // one basis row per temperature, then a single basis x coefficient matrix product
+  calc_range_hsg_batch(
+    nasa_type: NASARangeType,
+    temperatures_K: ArrayLike<number>,
+    prop_name: PropName
+  ): { reaction_ids: readonly string[]; values: Float64Array } {
+    const basis = this.prop_bases.get(prop_name);
+    if (!basis) throw new Error(`Unsupported property: ${String(prop_name)}`);
+    const { reaction_ids, stride, matrix } = this.get_range_coefficients(nasa_type);
+
+    const bases = new Float64Array(temperatures_K.length * stride);
+    for (let m = 0; m < temperatures_K.length; m++) {
+      basis(temperatures_K[m], bases.subarray(m * stride, (m + 1) * stride));
+    }
+    return { reaction_ids, values: evalBasisMatrix(bases, matrix, stride) };
+  }
+
+  // NOTE: Calculate a property for all components over Kelvin temperatures
+  // temperatures are grouped by NASA range and each group is one calc_range_hsg_batch evaluation;
+  // values holds one array per component with data in any range, aligned with temperatures_K
+  // (NaN where a temperature is invalid or the component has no data in its range); null only when no component has data
+  calc_components_hsg_sweep(
+    temperatures_K: ArrayLike<number>,
+    prop_name: PropName,
+    opts?: { reaction_ids?: boolean }
+  ): { values: Record<string, Float64Array>; unit: string } | null {
+    if (!this.prop_bases.has(prop_name)) return null;
+
+    const n = temperatures_K.length;
+    const ranges = NASA_RANGES[this.nasa_type];
+    const values: Record<string, Float64Array> = {};
+    for (const range of ranges) {
+      const { ids, reaction_ids } = this.get_range_coefficients(range);
+      for (const key of opts?.reaction_ids ? reaction_ids : ids) {
+        values[key] ??= new Float64Array(n).fill(NaN);
+      }
+    }
+    if (!Object.keys(values).length) return null;
+
+    const groups: number[][] = [[], [], []];
+    for (let i = 0; i < n; i++) {
+      const T = temperatures_K[i];
+      if (Number.isFinite(T) && T > 0) groups[nasaRangeIndex(T, this.nasa_type)].push(i);
+    }
+
+    ranges.forEach((range, r) => {
+      const idx = groups[r];
+      if (!idx.length) return;
+
+      const { ids } = this.get_range_coefficients(range);
+      const { reaction_ids, values: matrix } = this.calc_range_hsg_batch(
+        range,
+        Float64Array.from(idx, (i) => temperatures_K[i]),
+        prop_name
+      );
+      const keys = opts?.reaction_ids ? reaction_ids : ids;
+      const m = keys.length;
+      for (let c = 0; c < m; c++) {
+        const column = values[keys[c]];
+        for (let k = 0; k < idx.length; k++) column[idx[k]] = matrix[k * m + c];
       }
+    });
+
+    return { values, unit: PROP_BASES[prop_name].unit };
+  }
+
+  // NOTE: Tabulate every property on a Kelvin grid for calc_components_hsg_interp
+  // grid points are split per NASA range so interpolation never crosses a range break; replaces earlier tables
+  tabulate(temperatures_K: ArrayLike<number>): void {
+    const grid = Float64Array.from(temperatures_K)
+      .filter((T) => Number.isFinite(T) && T > 0)
+      .sort()
+      .filter((T, i, sorted) => i === 0 || T !== sorted[i - 1]);
+
+    this.range_tables.clear();
+    NASA_RANGES[this.nasa_type].forEach((range, idx) => {
+      const points = grid.filter((T) => nasaRangeIndex(T, this.nasa_type) === idx);
+      if (points.length < 2) return;
 
-      if (opts?.reaction_ids) {
-        hsgs_data[this.reaction_component_ids[id]] = res;
-      } else {
-        hsgs_data[id] = res;
+      for (const prop_name of Object.keys(PROP_BASES) as PropName[]) {
+        let tables = this.range_tables.get(prop_name);
+        if (!tables) {
+          tables = new Map();
+          this.range_tables.set(prop_name, tables);
+        }
+        const { values } = this.calc_range_hsg_batch(range, points, prop_name);
+        tables.set(range, { temperatures_K: points, values });
       }
+    });
+  }
+
+  // NOTE: Calculate a property for all components by linear interpolation in the tabulated grid
+  // falls back to calc_components_hsg when no table covers the temperature
+  calc_components_hsg_interp(
+    temperature: Temperature,
+    prop_name: PropName,
+    opts?: { reaction_ids?: boolean }
+  ): Record<string, CustomProp> | null {
+    const T = toKelvin(temperature);
+    if (!Number.isFinite(T) || T <= 0) return null;
+
+    const nasa_type_selected = selectNasaRangeK(T, this.nasa_type);
+    const table = this.range_tables.get(prop_name)?.get(nasa_type_selected);
+    const grid = table?.temperatures_K;
+    if (!table || !grid || T < grid[0] || T > grid[grid.length - 1]) {
+      return this.calc_components_hsg(temperature, prop_name, opts);
     }
 
-    return Object.keys(hsgs_data).length ? hsgs_data : null;
+    const { ids, reaction_ids } = this.get_range_coefficients(nasa_type_selected);
+    const n = ids.length;
+    if (!n) return null;
+
+    // NOTE: bracketing grid points by binary search
+    let lo = 0;
+    let hi = grid.length - 1;
+    while (hi - lo > 1) {
+      const mid = (lo + hi) >> 1;
+      if (grid[mid] <= T) lo = mid;
+      else hi = mid;
+    }
+    const w = (T - grid[lo]) / (grid[hi] - grid[lo]);
+
+    const { unit } = PROP_BASES[prop_name];
+    const keys = opts?.reaction_ids ? reaction_ids : ids;
+    const { values } = table;
+    const res: Record<string, CustomProp> = {};
+    for (let i = 0; i < n; i++) {
+      const a = values[lo * n + i];
+      res[keys[i]] = { value: a + w * (values[hi * n + i] - a), unit };
+    }
+    return res;
   }
 }
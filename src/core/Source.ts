@@ -11,8 +11,18 @@ import { setComponentId } from '@/utils/component';
 
 type RangeLookup = { range: NASARangeType; data: TemperatureRangeData };
 
+// NOTE: keys required for a range record to be usable
+const BASE_KEYS = ['a1', 'a2', 'a3', 'a4', 'a5', 'a6', 'a7', 'MW'] as const;
+const NASA9_KEYS = ['b1', 'b2'] as const;
+const METADATA_KEYS = ['EnFo_IG', 'dEnFo_IG_298', 'Tmin', 'Tmax', 'phase_flag'] as const;
+const REQUIRED_KEYS_NASA9: readonly string[] = Object.freeze([...BASE_KEYS, ...NASA9_KEYS, ...METADATA_KEYS]);
+const REQUIRED_KEYS_NASA7: readonly string[] = Object.freeze([...BASE_KEYS, ...METADATA_KEYS]);
+
 // LINK: Source class to retrieve NASA polynomial data for components
 export class Source implements SourceType {
+  // NOTE: validation result per range record (records are treated as immutable once loaded)
+  private readonly validated = new WeakMap<TemperatureRangeData, boolean>();
+
   // NOTE: Constructor
   constructor(
     public readonly model_source: ModelSource,
@@ -24,12 +34,15 @@ export class Source implements SourceType {
     component: Component;
     componentKey: ComponentKey | string;
     propName: NASARangeType;
+    componentId?: string;
   }): ComponentEquationSource | null {
-    // ! component key
-    const componentKey = (args.componentKey as ComponentKey | undefined) ?? this.component_key;
-
-    // ! component id
-    const componentId = setComponentId({ component: args.component, componentKey });
+    // ! component id (reuse the caller's cached id when given)
+    const componentId =
+      args.componentId ??
+      setComponentId({
+        component: args.component,
+        componentKey: (args.componentKey as ComponentKey | undefined) ?? this.component_key
+      });
 
     // ! compound data
     const compoundData = this.model_source[componentId];
@@ -79,30 +92,21 @@ export class Source implements SourceType {
     return [preferredRange, ...baseOrder.filter((range) => range !== preferredRange)];
   }
 
-  // NOTE: Private method to validate the completeness of range data
+  // NOTE: Private method to validate the completeness of range data (checked once per record)
   private validateRangeData(
     rangeData: TemperatureRangeData,
     range: NASARangeType
   ): TemperatureRangeData | null {
-    const baseKeys = ['a1', 'a2', 'a3', 'a4', 'a5', 'a6', 'a7', 'MW'] as const;
-    const nasa9Keys = ['b1', 'b2'] as const;
-    const metadataKeys = [
-      'EnFo_IG',
-      'dEnFo_IG_298',
-      'Tmin',
-      'Tmax',
-      'phase_flag'
-    ] as const;
-
-    const required = range.startsWith('nasa9')
-      ? [...baseKeys, ...nasa9Keys, ...metadataKeys]
-      : [...baseKeys, ...metadataKeys];
-
-    const hasMissing = required.some((key) => {
-      const value = (rangeData as any)[key];
-      return value === undefined || Number.isNaN(Number(value));
-    });
+    let valid = this.validated.get(rangeData);
+    if (valid === undefined) {
+      const required = range.startsWith('nasa9') ? REQUIRED_KEYS_NASA9 : REQUIRED_KEYS_NASA7;
+      valid = required.every((key) => {
+        const value = (rangeData as any)[key];
+        return value !== undefined && !Number.isNaN(Number(value));
+      });
+      this.validated.set(rangeData, valid);
+    }
 
-    return hasMissing ? null : rangeData;
+    return valid ? rangeData : null;
   }
 }
@@ -38,6 +38,9 @@ export {
     dCp_rxn_STD,
     Keq,
     Keq_vh_shortcut,
+    dG_rxn_STD_batch,
+    Keq_curve,
+    Keq_vh_shortcut_curve,
     dlnKeq_dT,
     dG_rxn_dT,
     dlnK_dInvT,
@@ -49,6 +52,11 @@ export {
     S_T_series,
     G_T_series,
     Cp_T_series,
+    H_T_batch,
+    S_T_batch,
+    G_T_batch,
+    Cp_T_batch,
+    HSCp_T,
     H_mix_T,
     H_mix_T_series,
     S_mix_T,
@@ -65,6 +73,7 @@ export {
     dS_rxn_STD_series,
     dH_rxn_STD_series,
     Keq_series,
+    Keq_vh_shortcut_series,
     equilibrium_temperature,
     equilibrium_temperature_K1,
     species_contribution_enthalpy,
@@ -116,9 +116,7 @@ export class MIXTURE {
                 if (y === 0) continue;
 
                 const prop = this.getComponentProp(H_i_IG, component);
-                if (!prop) {
-                    throw new Error(`Missing enthalpy for component '${component.name}'.`);
-                }
+                if (!prop) return null;
 
                 const { value } = ensureEnergy(prop);
                 H_mix += y * value;
@@ -163,9 +161,7 @@ export class MIXTURE {
                 if (y === 0) continue;
 
                 const prop = this.getComponentProp(S_i_IG, component);
-                if (!prop) {
-                    throw new Error(`Missing entropy for component '${component.name}'.`);
-                }
+                if (!prop) return null;
 
                 const { value } = ensureEntropy(prop);
                 S_mix += y * value;
@@ -216,9 +212,7 @@ export class MIXTURE {
                 if (y === 0) continue;
 
                 const prop = this.getComponentProp(Cp_i_IG, component);
-                if (!prop) {
-                    throw new Error(`Missing heat capacity for component '${component.name}'.`);
-                }
+                if (!prop) return null;
 
                 const { value } = ensureEntropy(prop);
                 Cp_mix += y * value;
@@ -266,9 +260,7 @@ export class MIXTURE {
                 if (y === 0) continue;
 
                 const prop = this.getComponentProp(G_i_IG, component);
-                if (!prop) {
-                    throw new Error(`Missing Gibbs energy for component '${component.name}'.`);
-                }
+                if (!prop) return null;
 
                 const { value } = ensureEnergy(prop);
                 G_mix += y * value;
@@ -321,9 +313,7 @@ export class MIXTURE {
             for (const component of this.components) {
                 const y = component.moleFraction || 0;
                 const prop = this.getComponentProp(G_i_IG, component);
-                if (!prop) {
-                    throw new Error(`Missing Gibbs energy for component '${component.name}'.`);
-                }
+                if (!prop) return null;
 
                 // SECTION: chemical potential calculation: mu_i = G_i + RT ln(y_i) + RT ln(P/P_ref)
                 const { value } = ensureEnergy(prop);
@@ -333,9 +323,7 @@ export class MIXTURE {
 
                 if (basis === 'mass') {
                     const mw = this.getComponentMW(component, MW_i);
-                    if (!mw) {
-                        throw new Error(`Missing molecular weight for component '${component.name}'.`);
-                    }
+                    if (!mw) return null;
                     mu = toMassBasis(mu, mw);
                 }
 
@@ -20,92 +20,64 @@ import { bisectRoot, integrateTrapezoidal } from '@/utils/mathMethods';
 export class RXN {
   private readonly R = R_CONST_J__molK;
   private readonly T_ref = TEMPERATURE_REF_K;
+  // NOTE: stoichiometry read once from the analysis into parallel id / coefficient arrays
+  private readonly stoich_ids: readonly string[];
+  private readonly stoich_coeffs: Float64Array;
 
   // NOTE: Constructor
   constructor(private readonly reaction: ReactionAnalysis) {
     if (reaction.component_checker === false) {
       throw new Error('Some components in the reaction are not available in the provided components list.');
     }
+    this.stoich_ids = Object.keys(reaction.reaction_stoichiometry);
+    this.stoich_coeffs = Float64Array.from(this.stoich_ids, (id) => reaction.reaction_stoichiometry[id]);
   }
 
-  // SECTION: Calculate enthalpy of reaction
-  dH_rxn_STD(H_i_IG: Record<string, CustomProp>): CustomProp | null {
-    try {
-      let reaction_enthalpy = 0;
-
-      // iterate over reaction stoichiometry
-      for (const [component_id, coeff] of Object.entries(this.reaction.reaction_stoichiometry)) {
-        const prop = H_i_IG[component_id];
-        if (!prop) throw new Error(`Component ID '${component_id}' not found in H_i_IG dictionary.`);
-        const { value } = ensureEnergy(prop);
-        reaction_enthalpy += coeff * value;
-      }
+  // NOTE: stoichiometric sum over keyed component props; try-free, unit errors propagate to the caller
+  private _stoich_sum(props: Record<string, CustomProp>, ensure: (prop: CustomProp) => CustomProp): number | null {
+    const ids = this.stoich_ids;
+    const coeffs = this.stoich_coeffs;
+    let sum = 0;
+    for (let i = 0; i < ids.length; i++) {
+      const prop = props[ids[i]];
+      if (!prop) return null;
+      sum += coeffs[i] * ensure(prop).value;
+    }
+    return sum;
+  }
 
-      // res
-      return { value: reaction_enthalpy, unit: 'J/mol' };
-    } catch (err) {
+  // NOTE: single frame that maps unit errors of _stoich_sum to null
+  private _reaction_sum(
+    props: Record<string, CustomProp>,
+    ensure: (prop: CustomProp) => CustomProp,
+    unit: string
+  ): CustomProp | null {
+    try {
+      const value = this._stoich_sum(props, ensure);
+      return value === null ? null : { value, unit };
+    } catch {
       return null;
     }
   }
 
+  // SECTION: Calculate enthalpy of reaction
+  dH_rxn_STD(H_i_IG: Record<string, CustomProp>): CustomProp | null {
+    return this._reaction_sum(H_i_IG, ensureEnergy, 'J/mol');
+  }
+
   // SECTION: Calculate Gibbs energy of reaction
   dG_rxn_STD(G_i_IG: Record<string, CustomProp>): CustomProp | null {
-    try {
-      let reaction_gibbs = 0;
-
-      // iterate over reaction stoichiometry
-      for (const [component_id, coeff] of Object.entries(this.reaction.reaction_stoichiometry)) {
-        const prop = G_i_IG[component_id];
-        if (!prop) throw new Error(`Component ID '${component_id}' not found in G_i_IG dictionary.`);
-        const { value } = ensureEnergy(prop);
-        reaction_gibbs += coeff * value;
-      }
-
-      // res
-      return { value: reaction_gibbs, unit: 'J/mol' };
-    } catch (err) {
-      return null;
-    }
+    return this._reaction_sum(G_i_IG, ensureEnergy, 'J/mol');
   }
 
   // SECTION: Calculate Entropy of reaction
   dS_rxn_STD(S_i_IG: Record<string, CustomProp>): CustomProp | null {
-    try {
-      let reaction_entropy = 0;
-
-      // iterate over reaction stoichiometry
-      for (const [component_id, coeff] of Object.entries(this.reaction.reaction_stoichiometry)) {
-        const prop = S_i_IG[component_id];
-        if (!prop) throw new Error(`Component ID '${component_id}' not found in S_i_IG dictionary.`);
-        const { value } = ensureEntropy(prop);
-        reaction_entropy += coeff * value;
-      }
-
-      // res
-      return { value: reaction_entropy, unit: 'J/mol.K' };
-    } catch (err) {
-      return null;
-    }
+    return this._reaction_sum(S_i_IG, ensureEntropy, 'J/mol.K');
   }
 
   // SECTION: Calculate heat capacity of reaction
   dCp_rxn_STD(Cp_i_IG: Record<string, CustomProp>): CustomProp | null {
-    try {
-      let reaction_cp = 0;
-
-      // iterate over reaction stoichiometry
-      for (const [component_id, coeff] of Object.entries(this.reaction.reaction_stoichiometry)) {
-        const prop = Cp_i_IG[component_id];
-        if (!prop) throw new Error(`Component ID '${component_id}' not found in Cp_i_IG dictionary.`);
-        const { value } = ensureEntropy(prop);
-        reaction_cp += coeff * value;
-      }
-
-      // res
-      return { value: reaction_cp, unit: 'J/mol.K' };
-    } catch (err) {
-      return null;
-    }
+    return this._reaction_sum(Cp_i_IG, ensureEntropy, 'J/mol.K');
   }
 
   // SECTION: Species contribution to reaction enthalpy (per-species H_i)
@@ -113,9 +85,9 @@ export class RXN {
     try {
       const contributions: Record<string, CustomProp> = {};
 
-      for (const component_id of Object.keys(this.reaction.reaction_stoichiometry)) {
+      for (const component_id of this.stoich_ids) {
         const prop = H_i_IG[component_id];
-        if (!prop) throw new Error(`Component ID '${component_id}' not found in H_i_IG dictionary.`);
+        if (!prop) return null;
         const { value } = ensureEnergy(prop);
         contributions[component_id] = { value, unit: 'J/mol' };
       }
@@ -131,9 +103,9 @@ export class RXN {
     try {
       const contributions: Record<string, CustomProp> = {};
 
-      for (const component_id of Object.keys(this.reaction.reaction_stoichiometry)) {
+      for (const component_id of this.stoich_ids) {
         const prop = G_i_IG[component_id];
-        if (!prop) throw new Error(`Component ID '${component_id}' not found in G_i_IG dictionary.`);
+        if (!prop) return null;
         const { value } = ensureEnergy(prop);
         contributions[component_id] = { value, unit: 'J/mol' };
       }
@@ -173,7 +145,8 @@ export class RXN {
       const integral = integrateTrapezoidal(
         (temp: number) => {
           const dH = dH_rxn_STD_func({ value: temp, unit: 'K' });
-          if (!dH) throw new Error(`ΔH missing at T=${temp}`);
+          // NOTE: static message, the error only aborts the integration and is discarded by the catch below
+          if (!dH) throw new Error('ΔH missing');
           return ensureEnergy(dH).value / (temp * temp);
         },
         T0,
@@ -303,7 +276,8 @@ export class RXN {
       const lnK = Math.log(Keq_target.value);
       const f = (temp: number) => {
         const dG = dG_rxn_STD_func({ value: temp, unit: 'K' });
-        if (!dG) throw new Error(`ΔG missing at T=${temp}`);
+        // NOTE: static message, the error only aborts the solver and is discarded by the catch below
+        if (!dG) throw new Error('ΔG missing');
         return ensureEnergy(dG).value + this.R * temp * lnK;
       };
 
@@ -10,6 +10,8 @@ import { RXN } from './RXN';
 export class RXNAdapter {
   private readonly analysis: ReactionAnalysis;
   private readonly rxn: RXN;
+  // NOTE: stoichiometry vectors cached per component id ordering
+  private readonly _nu = new WeakMap<readonly string[], Float64Array | null>();
 
   // NOTE: constructor
   constructor(private readonly reaction: Reaction) {
@@ -25,6 +27,81 @@ export class RXNAdapter {
     return this.analysis;
   }
 
+  // NOTE: stoichiometric coefficients aligned with component_ids (null if a reaction component is missing)
+  stoichiometry_vector(component_ids: readonly string[]): Float64Array | null {
+    let nu = this._nu.get(component_ids);
+    if (nu === undefined) {
+      const index = new Map<string, number>();
+      component_ids.forEach((id, i) => index.set(id, i));
+
+      nu = new Float64Array(component_ids.length);
+      for (const [component_id, coeff] of Object.entries(this.analysis.reaction_stoichiometry)) {
+        const i = index.get(component_id);
+        if (i === undefined) {
+          nu = null;
+          break;
+        }
+        nu[i] = coeff;
+      }
+      this._nu.set(component_ids, nu);
+    }
+    return nu;
+  }
+
+  // NOTE: stoichiometric sum over a component vector already in SI units (no per-component unit checks)
+  private _nu_dot(reaction_ids: readonly string[], values: ArrayLike<number>): number | null {
+    const nu = this.stoichiometry_vector(reaction_ids);
+    if (!nu) return null;
+
+    let sum = 0;
+    for (let i = 0; i < nu.length; i++) {
+      sum += nu[i] * values[i];
+    }
+    return sum;
+  }
+
+  // SECTION: Calculate reaction Gibbs free energy from a component vector (J/mol)
+  dG_rxn_std_vec({ reaction_ids, values }: { reaction_ids: readonly string[]; values: ArrayLike<number> }): CustomProp | null {
+    const value = this._nu_dot(reaction_ids, values);
+    return value === null ? null : { value, unit: 'J/mol' };
+  }
+
+  // SECTION: Calculate reaction enthalpy from a component vector (J/mol)
+  dH_rxn_std_vec({ reaction_ids, values }: { reaction_ids: readonly string[]; values: ArrayLike<number> }): CustomProp | null {
+    const value = this._nu_dot(reaction_ids, values);
+    return value === null ? null : { value, unit: 'J/mol' };
+  }
+
+  // SECTION: Calculate reaction entropy from a component vector (J/mol.K)
+  dS_rxn_std_vec({ reaction_ids, values }: { reaction_ids: readonly string[]; values: ArrayLike<number> }): CustomProp | null {
+    const value = this._nu_dot(reaction_ids, values);
+    return value === null ? null : { value, unit: 'J/mol.K' };
+  }
+
+  // SECTION: Calculate reaction heat capacity from a component vector (J/mol.K)
+  dCp_rxn_std_vec({ reaction_ids, values }: { reaction_ids: readonly string[]; values: ArrayLike<number> }): CustomProp | null {
+    const value = this._nu_dot(reaction_ids, values);
+    return value === null ? null : { value, unit: 'J/mol.K' };
+  }
+
+  // SECTION: Calculate reaction Gibbs free energy for a row-major (temperatures x components) matrix (J/mol)
+  dG_rxn_std_mat({ reaction_ids, values }: { reaction_ids: readonly string[]; values: ArrayLike<number> }): Float64Array | null {
+    const nu = this.stoichiometry_vector(reaction_ids);
+    if (!nu) return null;
+
+    const N = nu.length;
+    const M = N ? values.length / N : 0;
+    const out = new Float64Array(M);
+    for (let m = 0; m < M; m++) {
+      let reaction_gibbs = 0;
+      for (let i = 0; i < N; i++) {
+        reaction_gibbs += nu[i] * values[m * N + i];
+      }
+      out[m] = reaction_gibbs;
+    }
+    return out;
+  }
+
   // SECTION: Calculate reaction enthalpy
   dH_rxn_std({ H_i_IG }: { H_i_IG: Record<string, CustomProp> }): CustomProp | null {
     return this.rxn.dH_rxn_STD(H_i_IG);
@@ -1,5 +1,6 @@
 import { CustomProp, Temperature } from '@/types/models';
 import { toKelvin } from '@/utils/unitConverter';
+import { En_IG_NASA9_kernel, En_IG_NASA7_kernel } from './kernels';
 
 type NASA9Args = {
   a1: number; a2: number; a3: number; a4: number; a5: number; a6: number; a7: number; b1: number; b2: number;
@@ -17,26 +18,19 @@ export function En_IG_NASA9_polynomial(args: NASA9Args & { temperature: Temperat
   const T = toKelvin(args.temperature);
   if (!Number.isFinite(T) || T <= 0) return null;
   const { a1, a2, a3, a4, a5, a6, a7, b1 } = args;
-  const value =
-    R *
-    (
-      -a1 / T +
-      a2 * Math.log(T) +
-      a3 * T +
-      (a4 / 2) * T ** 2 +
-      (a5 / 3) * T ** 3 +
-      (a6 / 4) * T ** 4 +
-      (a7 / 5) * T ** 5 +
-      b1
-    );
+  // NOTE: Horner form for the polynomial part
+  const value = R * (-a1 / T + a2 * Math.log(T) + b1 + T * (a3 + T * (a4 / 2 + T * (a5 / 3 + T * (a6 / 4 + T * (a7 / 5))))));
   return { value, unit: 'J/mol' };
 }
 
 // NOTE: Enthalpy of Ideal Gas Calculations for Temperature Ranges
 export function En_IG_NASA9_polynomial_range(args: NASA9Args & { temperatures: Temperature[] }): CustomProp[] | null {
-  const results = args.temperatures.map((temperature) =>
-    En_IG_NASA9_polynomial({ ...args, temperature })?.value ?? null
-  );
+  // NOTE: coefficients are packed once; each temperature only converts to Kelvin and runs the kernel
+  const c = [args.a1, args.a2, args.a3, args.a4, args.a5, args.a6, args.a7, args.b1, args.b2];
+  const results = args.temperatures.map((temperature) => {
+    const T = toKelvin(temperature);
+    return Number.isFinite(T) && T > 0 ? En_IG_NASA9_kernel(T, c) : null;
+  });
   if (results.every((v) => v === null)) return null;
   return results.map((v) => ({ value: v ?? 0, unit: 'J/mol' }));
 }
@@ -51,25 +45,19 @@ export function En_IG_NASA7_polynomial(args: NASA7Args & { temperature: Temperat
   const T = toKelvin(args.temperature);
   if (!Number.isFinite(T) || T <= 0) return null;
   const { a1, a2, a3, a4, a5, a6 } = args;
-  const value =
-    R *
-    T *
-    (
-      a1 +
-      (a2 * T) / 2 +
-      (a3 * T ** 2) / 3 +
-      (a4 * T ** 3) / 4 +
-      (a5 * T ** 4) / 5 +
-      a6 / T
-    );
+  // NOTE: Horner form for the polynomial part
+  const value = R * (a6 + T * (a1 + T * (a2 / 2 + T * (a3 / 3 + T * (a4 / 4 + T * (a5 / 5))))));
   return { value, unit: 'J/mol' };
 }
 
 // NOTE: Enthalpy of Ideal Gas Calculations for Temperature Ranges using NASA 7 Coefficients
 export function En_IG_NASA7_polynomial_range(args: NASA7Args & { temperatures: Temperature[] }): CustomProp[] | null {
-  const results = args.temperatures.map((temperature) =>
-    En_IG_NASA7_polynomial({ ...args, temperature })?.value ?? null
-  );
+  // NOTE: coefficients are packed once; each temperature only converts to Kelvin and runs the kernel
+  const c = [args.a1, args.a2, args.a3, args.a4, args.a5, args.a6, args.a7];
+  const results = args.temperatures.map((temperature) => {
+    const T = toKelvin(temperature);
+    return Number.isFinite(T) && T > 0 ? En_IG_NASA7_kernel(T, c) : null;
+  });
   if (results.every((v) => v === null)) return null;
   return results.map((v) => ({ value: v ?? 0, unit: 'J/mol' }));
 }
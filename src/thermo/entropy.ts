@@ -1,5 +1,6 @@
 import { CustomProp, Temperature } from '@/types/models';
 import { toKelvin } from '@/utils/unitConverter';
+import { S_IG_NASA9_kernel, S_IG_NASA7_kernel } from './kernels';
 
 type NASA9Args = {
   a1: number; a2: number; a3: number; a4: number; a5: number; a6: number; a7: number; b1: number; b2: number;
@@ -17,24 +18,20 @@ export function S_IG_NASA9_polynomial(args: NASA9Args & { temperature: Temperatu
   const T = toKelvin(args.temperature);
   if (!Number.isFinite(T) || T <= 0) return null;
   const { a1, a2, a3, a4, a5, a6, a7, b2 } = args;
-  const value =
-    R *
-    (-a1 / (2 * T ** 2) -
-      a2 / T +
-      a3 * Math.log(T) +
-      a4 * T +
-      (a5 / 2) * T ** 2 +
-      (a6 / 3) * T ** 3 +
-      (a7 / 4) * T ** 4 +
-      b2);
+  // NOTE: Horner form for the polynomial part
+  const invT = 1 / T;
+  const value = R * (invT * (-a1 / 2 * invT - a2) + a3 * Math.log(T) + b2 + T * (a4 + T * (a5 / 2 + T * (a6 / 3 + T * (a7 / 4)))));
   return { value, unit: 'J/mol.K' };
 }
 
 // NOTE: Entropy of Ideal Gas Calculations for Temperature Ranges
 export function S_IG_NASA9_polynomial_range(args: NASA9Args & { temperatures: Temperature[] }): CustomProp[] | null {
-  const results = args.temperatures.map((temperature) =>
-    S_IG_NASA9_polynomial({ ...args, temperature })?.value ?? null
-  );
+  // NOTE: coefficients are packed once; each temperature only converts to Kelvin and runs the kernel
+  const c = [args.a1, args.a2, args.a3, args.a4, args.a5, args.a6, args.a7, args.b1, args.b2];
+  const results = args.temperatures.map((temperature) => {
+    const T = toKelvin(temperature);
+    return Number.isFinite(T) && T > 0 ? S_IG_NASA9_kernel(T, c) : null;
+  });
   if (results.every((v) => v === null)) return null;
   return results.map((v) => ({ value: v ?? 0, unit: 'J/mol.K' }));
 }
@@ -49,22 +46,19 @@ export function S_IG_NASA7_polynomial(args: NASA7Args & { temperature: Temperatu
   const T = toKelvin(args.temperature);
   if (!Number.isFinite(T) || T <= 0) return null;
   const { a1, a2, a3, a4, a5, a7 } = args;
-  const value =
-    R *
-    (a1 * Math.log(T) +
-      a2 * T +
-      (a3 / 2) * T ** 2 +
-      (a4 / 3) * T ** 3 +
-      (a5 / 4) * T ** 4 +
-      a7);
+  // NOTE: Horner form for the polynomial part
+  const value = R * (a1 * Math.log(T) + a7 + T * (a2 + T * (a3 / 2 + T * (a4 / 3 + T * (a5 / 4)))));
   return { value, unit: 'J/mol.K' };
 }
 
 // NOTE: Entropy of Ideal Gas Calculations for Temperature Ranges
 export function S_IG_NASA7_polynomial_range(args: NASA7Args & { temperatures: Temperature[] }): CustomProp[] | null {
-  const results = args.temperatures.map((temperature) =>
-    S_IG_NASA7_polynomial({ ...args, temperature })?.value ?? null
-  );
+  // NOTE: coefficients are packed once; each temperature only converts to Kelvin and runs the kernel
+  const c = [args.a1, args.a2, args.a3, args.a4, args.a5, args.a6, args.a7];
+  const results = args.temperatures.map((temperature) => {
+    const T = toKelvin(temperature);
+    return Number.isFinite(T) && T > 0 ? S_IG_NASA7_kernel(T, c) : null;
+  });
   if (results.every((v) => v === null)) return null;
   return results.map((v) => ({ value: v ?? 0, unit: 'J/mol.K' }));
 }
@@ -1,7 +1,6 @@
 import { CustomProp, Temperature } from '@/types/models';
 import { toKelvin } from '@/utils/unitConverter';
-import { En_IG_NASA7_polynomial, En_IG_NASA9_polynomial } from './enthalpy';
-import { S_IG_NASA7_polynomial, S_IG_NASA9_polynomial } from './entropy';
+import { En_IG_NASA9_kernel, En_IG_NASA7_kernel, S_IG_NASA9_kernel, S_IG_NASA7_kernel } from './kernels';
 
 type NASA9Args = {
   method: 'NASA9';
@@ -17,26 +16,33 @@ type GiArgs = (NASA9Args | NASA7Args) & { temperature: Temperature };
 type GiRangeArgs = (NASA9Args | NASA7Args) & { temperatures: Temperature[] };
 
 // NOTE: Gibbs Free Energy of Ideal Gas Calculations
+// NOTE: the temperature is converted once and H, S come from the numeric kernels
 export function GiFrEn_IG(args: GiArgs): CustomProp | null {
   const T = toKelvin(args.temperature);
-  const H =
+  if (!Number.isFinite(T) || T <= 0) return null;
+  const c =
     args.method === 'NASA9'
-      ? En_IG_NASA9_polynomial({ ...args, temperature: args.temperature })?.value ?? null
-      : En_IG_NASA7_polynomial({ ...args, temperature: args.temperature })?.value ?? null;
-  const S =
-    args.method === 'NASA9'
-      ? S_IG_NASA9_polynomial({ ...args, temperature: args.temperature })?.value ?? null
-      : S_IG_NASA7_polynomial({ ...args, temperature: args.temperature })?.value ?? null;
-  if (H === null || S === null) return null;
+      ? [args.a1, args.a2, args.a3, args.a4, args.a5, args.a6, args.a7, args.b1, args.b2]
+      : [args.a1, args.a2, args.a3, args.a4, args.a5, args.a6, args.a7];
+  const H = args.method === 'NASA9' ? En_IG_NASA9_kernel(T, c) : En_IG_NASA7_kernel(T, c);
+  const S = args.method === 'NASA9' ? S_IG_NASA9_kernel(T, c) : S_IG_NASA7_kernel(T, c);
   const value = H - T * S;
   return { value, unit: 'J/mol' };
 }
 
 // NOTE: Gibbs Free Energy of Ideal Gas Calculations for Temperature Ranges
 export function GiFrEn_IG_ranges(args: GiRangeArgs): CustomProp[] | null {
-  const results = args.temperatures.map((temperature) =>
-    GiFrEn_IG({ ...(args as any), temperature })?.value ?? null
-  );
+  // NOTE: coefficients and kernels are bound once; each temperature only converts to Kelvin and evaluates H - T*S
+  const c =
+    args.method === 'NASA9'
+      ? [args.a1, args.a2, args.a3, args.a4, args.a5, args.a6, args.a7, args.b1, args.b2]
+      : [args.a1, args.a2, args.a3, args.a4, args.a5, args.a6, args.a7];
+  const En = args.method === 'NASA9' ? En_IG_NASA9_kernel : En_IG_NASA7_kernel;
+  const S = args.method === 'NASA9' ? S_IG_NASA9_kernel : S_IG_NASA7_kernel;
+  const results = args.temperatures.map((temperature) => {
+    const T = toKelvin(temperature);
+    return Number.isFinite(T) && T > 0 ? En(T, c) - T * S(T, c) : null;
+  });
   if (results.every((v) => v === null)) return null;
   return results.map((v) => ({ value: v ?? 0, unit: 'J/mol' }));
 }
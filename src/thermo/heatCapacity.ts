@@ -17,7 +17,9 @@ export function Cp_IG_NASA9_polynomial(args: NASA9Args & { temperature: Temperat
   const T = toKelvin(args.temperature);
   if (!Number.isFinite(T) || T <= 0) return null;
   const { a1, a2, a3, a4, a5, a6, a7 } = args;
-  const cpOverR = a1 / T ** 2 + a2 / T + a3 + a4 * T + a5 * T ** 2 + a6 * T ** 3 + a7 * T ** 4;
+  // NOTE: Horner form for the polynomial part
+  const invT = 1 / T;
+  const cpOverR = invT * (a1 * invT + a2) + a3 + T * (a4 + T * (a5 + T * (a6 + T * a7)));
   const value = R * cpOverR;
   return { value, unit: 'J/mol.K' };
 }
@@ -28,7 +30,8 @@ export function Cp_IG_NASA7_polynomial(args: NASA7Args & { temperature: Temperat
   const T = toKelvin(args.temperature);
   if (!Number.isFinite(T) || T <= 0) return null;
   const { a1, a2, a3, a4, a5 } = args;
-  const cpOverR = a1 + a2 * T + a3 * T ** 2 + a4 * T ** 3 + a5 * T ** 4;
+  // NOTE: Horner form
+  const cpOverR = a1 + T * (a2 + T * (a3 + T * (a4 + T * a5)));
   const value = R * cpOverR;
   return { value, unit: 'J/mol.K' };
 }
@@ -2,3 +2,4 @@ export * from './enthalpy';
 export * from './entropy';
 export * from './gibbs';
 export * from './heatCapacity';
+export * from './kernels';
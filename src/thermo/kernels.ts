@@ -0,0 +1,337 @@
+// NOTE: Numeric NASA polynomial kernels
+// Kernels take a Kelvin temperature and a positional coefficient vector and return a plain number,
+// so batch callers can evaluate many temperatures without building Temperature/CustomProp objects.
+// NASA 9 coefficient order: [a1, a2, a3, a4, a5, a6, a7, b1, b2]
+// NASA 7 coefficient order: [a1, a2, a3, a4, a5, a6, a7]
+
+const R = 8.31446261815324; // J/mol.K
+
+export type NASAKernel = (T: number, c: ArrayLike<number>) => number;
+// NOTE: writes [H (J/mol), S (J/mol.K), Cp (J/mol.K)] into out
+export type NASABundleKernel = (T: number, c: ArrayLike<number>, out: Float64Array) => Float64Array;
+
+// SECTION: NASA 9 Coefficients
+// NOTE: polynomial parts are evaluated in Horner form; the 1/T, 1/T^2 and log(T) terms are kept separate
+// NOTE: Enthalpy of Ideal Gas (J/mol)
+export function En_IG_NASA9_kernel(T: number, c: ArrayLike<number>): number {
+  return (
+    R *
+    (-c[0] / T + c[1] * Math.log(T) + c[7] + T * (c[2] + T * (c[3] / 2 + T * (c[4] / 3 + T * (c[5] / 4 + T * (c[6] / 5))))))
+  );
+}
+
+// NOTE: Entropy of Ideal Gas (J/mol.K)
+export function S_IG_NASA9_kernel(T: number, c: ArrayLike<number>): number {
+  const invT = 1 / T;
+  return (
+    R *
+    (invT * (-c[0] / 2 * invT - c[1]) + c[2] * Math.log(T) + c[8] + T * (c[3] + T * (c[4] / 2 + T * (c[5] / 3 + T * (c[6] / 4)))))
+  );
+}
+
+// NOTE: Gibbs Free Energy of Ideal Gas (J/mol)
+// fused H - T*S: one log and one read per coefficient instead of evaluating H and S separately
+export function GiFrEn_IG_NASA9_kernel(T: number, c: ArrayLike<number>): number {
+  const lnT = Math.log(T);
+  return (
+    R *
+    (-c[0] / (2 * T) +
+      c[1] * (lnT + 1) +
+      c[2] * T * (1 - lnT) +
+      c[7] +
+      T * (-c[8] - T * (c[3] / 2 + T * (c[4] / 6 + T * (c[5] / 12 + T * (c[6] / 20))))))
+  );
+}
+
+// NOTE: Heat Capacity of Ideal Gas (J/mol.K)
+export function Cp_IG_NASA9_kernel(T: number, c: ArrayLike<number>): number {
+  const invT = 1 / T;
+  return R * (invT * (c[0] * invT + c[1]) + c[2] + T * (c[3] + T * (c[4] + T * (c[5] + T * c[6]))));
+}
+
+// NOTE: Enthalpy, entropy and heat capacity of Ideal Gas sharing 1/T and log(T)
+export function HSCp_IG_NASA9_kernel(T: number, c: ArrayLike<number>, out: Float64Array = new Float64Array(3)): Float64Array {
+  const lnT = Math.log(T);
+  const invT = 1 / T;
+  const a1 = c[0], a2 = c[1], a3 = c[2], a4 = c[3], a5 = c[4], a6 = c[5], a7 = c[6];
+
+  out[0] = R * (-a1 * invT + a2 * lnT + c[7] + T * (a3 + T * (a4 / 2 + T * (a5 / 3 + T * (a6 / 4 + T * (a7 / 5))))));
+  out[1] = R * (invT * (-a1 / 2 * invT - a2) + a3 * lnT + c[8] + T * (a4 + T * (a5 / 2 + T * (a6 / 3 + T * (a7 / 4)))));
+  out[2] = R * (invT * (a1 * invT + a2) + a3 + T * (a4 + T * (a5 + T * (a6 + T * a7))));
+  return out;
+}
+
+// SECTION: NASA 7 Coefficients
+// NOTE: Enthalpy of Ideal Gas (J/mol)
+export function En_IG_NASA7_kernel(T: number, c: ArrayLike<number>): number {
+  return R * (c[5] + T * (c[0] + T * (c[1] / 2 + T * (c[2] / 3 + T * (c[3] / 4 + T * (c[4] / 5))))));
+}
+
+// NOTE: Entropy of Ideal Gas (J/mol.K)
+export function S_IG_NASA7_kernel(T: number, c: ArrayLike<number>): number {
+  return R * (c[0] * Math.log(T) + c[6] + T * (c[1] + T * (c[2] / 2 + T * (c[3] / 3 + T * (c[4] / 4)))));
+}
+
+// NOTE: Gibbs Free Energy of Ideal Gas (J/mol)
+// fused H - T*S: one log and one read per coefficient instead of evaluating H and S separately
+export function GiFrEn_IG_NASA7_kernel(T: number, c: ArrayLike<number>): number {
+  return (
+    R *
+    (c[0] * T * (1 - Math.log(T)) + c[5] + T * (-c[6] - T * (c[1] / 2 + T * (c[2] / 6 + T * (c[3] / 12 + T * (c[4] / 20))))))
+  );
+}
+
+// NOTE: Heat Capacity of Ideal Gas (J/mol.K)
+export function Cp_IG_NASA7_kernel(T: number, c: ArrayLike<number>): number {
+  return R * (c[0] + T * (c[1] + T * (c[2] + T * (c[3] + T * c[4]))));
+}
+
+// NOTE: Enthalpy, entropy and heat capacity of Ideal Gas sharing log(T)
+export function HSCp_IG_NASA7_kernel(T: number, c: ArrayLike<number>, out: Float64Array = new Float64Array(3)): Float64Array {
+  const a1 = c[0], a2 = c[1], a3 = c[2], a4 = c[3], a5 = c[4];
+
+  out[0] = R * (c[5] + T * (a1 + T * (a2 / 2 + T * (a3 / 3 + T * (a4 / 4 + T * (a5 / 5))))));
+  out[1] = R * (a1 * Math.log(T) + c[6] + T * (a2 + T * (a3 / 2 + T * (a4 / 3 + T * (a5 / 4)))));
+  out[2] = R * (a1 + T * (a2 + T * (a3 + T * (a4 + T * a5))));
+  return out;
+}
+
+// SECTION: Basis vectors
+// NOTE: a property is linear in the coefficients, so value = dot(c, basis(T)) with R folded into the basis;
+// one basis per temperature serves every component in a packed coefficient matrix
+export type NASABasis = (T: number, out: Float64Array) => Float64Array;
+
+// NOTE: NASA 9 Enthalpy basis (J/mol)
+export function En_IG_NASA9_basis(T: number, out: Float64Array = new Float64Array(9)): Float64Array {
+  const T2 = T * T, T3 = T2 * T, T4 = T3 * T;
+  out[0] = -R / T;
+  out[1] = R * Math.log(T);
+  out[2] = R * T;
+  out[3] = (R * T2) / 2;
+  out[4] = (R * T3) / 3;
+  out[5] = (R * T4) / 4;
+  out[6] = (R * T4 * T) / 5;
+  out[7] = R;
+  out[8] = 0;
+  return out;
+}
+
+// NOTE: NASA 9 Entropy basis (J/mol.K)
+export function S_IG_NASA9_basis(T: number, out: Float64Array = new Float64Array(9)): Float64Array {
+  const T2 = T * T, T3 = T2 * T;
+  out[0] = -R / (2 * T2);
+  out[1] = -R / T;
+  out[2] = R * Math.log(T);
+  out[3] = R * T;
+  out[4] = (R * T2) / 2;
+  out[5] = (R * T3) / 3;
+  out[6] = (R * T3 * T) / 4;
+  out[7] = 0;
+  out[8] = R;
+  return out;
+}
+
+// NOTE: NASA 9 Gibbs Free Energy basis (J/mol), H - T*S
+export function GiFrEn_IG_NASA9_basis(T: number, out: Float64Array = new Float64Array(9)): Float64Array {
+  const lnT = Math.log(T);
+  const T2 = T * T, T3 = T2 * T, T4 = T3 * T;
+  out[0] = -R / (2 * T);
+  out[1] = R * (lnT + 1);
+  out[2] = R * T * (1 - lnT);
+  out[3] = (-R * T2) / 2;
+  out[4] = (-R * T3) / 6;
+  out[5] = (-R * T4) / 12;
+  out[6] = (-R * T4 * T) / 20;
+  out[7] = R;
+  out[8] = -R * T;
+  return out;
+}
+
+// NOTE: NASA 9 Heat Capacity basis (J/mol.K)
+export function Cp_IG_NASA9_basis(T: number, out: Float64Array = new Float64Array(9)): Float64Array {
+  const T2 = T * T, T3 = T2 * T;
+  out[0] = R / T2;
+  out[1] = R / T;
+  out[2] = R;
+  out[3] = R * T;
+  out[4] = R * T2;
+  out[5] = R * T3;
+  out[6] = R * T3 * T;
+  out[7] = 0;
+  out[8] = 0;
+  return out;
+}
+
+// NOTE: NASA 7 Enthalpy basis (J/mol)
+export function En_IG_NASA7_basis(T: number, out: Float64Array = new Float64Array(7)): Float64Array {
+  const T2 = T * T, T3 = T2 * T, T4 = T3 * T;
+  out[0] = R * T;
+  out[1] = (R * T2) / 2;
+  out[2] = (R * T3) / 3;
+  out[3] = (R * T4) / 4;
+  out[4] = (R * T4 * T) / 5;
+  out[5] = R;
+  out[6] = 0;
+  return out;
+}
+
+// NOTE: NASA 7 Entropy basis (J/mol.K)
+export function S_IG_NASA7_basis(T: number, out: Float64Array = new Float64Array(7)): Float64Array {
+  const T2 = T * T, T3 = T2 * T;
+  out[0] = R * Math.log(T);
+  out[1] = R * T;
+  out[2] = (R * T2) / 2;
+  out[3] = (R * T3) / 3;
+  out[4] = (R * T3 * T) / 4;
+  out[5] = 0;
+  out[6] = R;
+  return out;
+}
+
+// NOTE: NASA 7 Gibbs Free Energy basis (J/mol), H - T*S
+export function GiFrEn_IG_NASA7_basis(T: number, out: Float64Array = new Float64Array(7)): Float64Array {
+  const T2 = T * T, T3 = T2 * T, T4 = T3 * T;
+  out[0] = R * T * (1 - Math.log(T));
+  out[1] = (-R * T2) / 2;
+  out[2] = (-R * T3) / 6;
+  out[3] = (-R * T4) / 12;
+  out[4] = (-R * T4 * T) / 20;
+  out[5] = R;
+  out[6] = -R * T;
+  return out;
+}
+
+// NOTE: NASA 7 Heat Capacity basis (J/mol.K)
+export function Cp_IG_NASA7_basis(T: number, out: Float64Array = new Float64Array(7)): Float64Array {
+  const T2 = T * T, T3 = T2 * T;
+  out[0] = R;
+  out[1] = R * T;
+  out[2] = R * T2;
+  out[3] = R * T3;
+  out[4] = R * T3 * T;
+  out[5] = 0;
+  out[6] = 0;
+  return out;
+}
+
+// NOTE: matrix-vector product of a row-major (rows x stride) coefficient matrix with a basis vector
+export function evalBasisAll(
+  basis: ArrayLike<number>,
+  matrix: ArrayLike<number>,
+  stride: number,
+  out: Float64Array = new Float64Array(matrix.length / stride)
+): Float64Array {
+  const rows = matrix.length / stride;
+  for (let i = 0, offset = 0; i < rows; i++, offset += stride) {
+    let sum = 0;
+    for (let k = 0; k < stride; k++) {
+      sum += matrix[offset + k] * basis[k];
+    }
+    out[i] = sum;
+  }
+  return out;
+}
+
+// NOTE: matrix-matrix product of row-major basis vectors (temperatures x stride) with a row-major
+// coefficient matrix (rows x stride); out is row-major (temperatures x rows)
+export function evalBasisMatrix(
+  bases: ArrayLike<number>,
+  matrix: ArrayLike<number>,
+  stride: number,
+  out: Float64Array = new Float64Array((bases.length / stride) * (matrix.length / stride))
+): Float64Array {
+  const M = bases.length / stride;
+  const N = matrix.length / stride;
+  for (let m = 0; m < M; m++) {
+    const b = m * stride;
+    for (let i = 0; i < N; i++) {
+      const c = i * stride;
+      let sum = 0;
+      for (let k = 0; k < stride; k++) {
+        sum += matrix[c + k] * bases[b + k];
+      }
+      out[m * N + i] = sum;
+    }
+  }
+  return out;
+}
+
+// SECTION: Specialized kernels
+// NOTE: a specializer folds R and the polynomial divisors into the coefficients of one NASA range once and
+// returns a closure over those constants (Horner form), so repeated scalar calls on the same range skip the
+// per-call scaling; closures are used instead of generated source so the bundle stays CSP-safe
+export type NASASpecializedKernel = (T: number) => number;
+export type NASASpecializer = (c: ArrayLike<number>) => NASASpecializedKernel;
+
+export function En_IG_NASA9_specialize(c: ArrayLike<number>): NASASpecializedKernel {
+  const h0 = -R * c[0], h1 = R * c[1], h2 = R * c[2], h3 = (R * c[3]) / 2, h4 = (R * c[4]) / 3;
+  const h5 = (R * c[5]) / 4, h6 = (R * c[6]) / 5, h7 = R * c[7];
+  return (T) => h0 / T + h1 * Math.log(T) + h7 + T * (h2 + T * (h3 + T * (h4 + T * (h5 + T * h6))));
+}
+
+export function S_IG_NASA9_specialize(c: ArrayLike<number>): NASASpecializedKernel {
+  const s0 = (-R * c[0]) / 2, s1 = -R * c[1], s2 = R * c[2], s3 = R * c[3], s4 = (R * c[4]) / 2;
+  const s5 = (R * c[5]) / 3, s6 = (R * c[6]) / 4, s8 = R * c[8];
+  return (T) => {
+    const invT = 1 / T;
+    return invT * (s0 * invT + s1) + s2 * Math.log(T) + s8 + T * (s3 + T * (s4 + T * (s5 + T * s6)));
+  };
+}
+
+export function GiFrEn_IG_NASA9_specialize(c: ArrayLike<number>): NASASpecializedKernel {
+  const g0 = (-R * c[0]) / 2, g1 = R * c[1], g2 = R * c[2], g3 = (-R * c[3]) / 2, g4 = (-R * c[4]) / 6;
+  const g5 = (-R * c[5]) / 12, g6 = (-R * c[6]) / 20, g7 = R * c[7], g8 = -R * c[8];
+  return (T) => {
+    const lnT = Math.log(T);
+    return g0 / T + g1 * (lnT + 1) + g2 * T * (1 - lnT) + g7 + T * (g8 + T * (g3 + T * (g4 + T * (g5 + T * g6))));
+  };
+}
+
+export function Cp_IG_NASA9_specialize(c: ArrayLike<number>): NASASpecializedKernel {
+  const c0 = R * c[0], c1 = R * c[1], c2 = R * c[2], c3 = R * c[3], c4 = R * c[4], c5 = R * c[5], c6 = R * c[6];
+  return (T) => {
+    const invT = 1 / T;
+    return invT * (c0 * invT + c1) + c2 + T * (c3 + T * (c4 + T * (c5 + T * c6)));
+  };
+}
+
+export function En_IG_NASA7_specialize(c: ArrayLike<number>): NASASpecializedKernel {
+  const h0 = R * c[0], h1 = (R * c[1]) / 2, h2 = (R * c[2]) / 3, h3 = (R * c[3]) / 4, h4 = (R * c[4]) / 5;
+  const h5 = R * c[5];
+  return (T) => h5 + T * (h0 + T * (h1 + T * (h2 + T * (h3 + T * h4))));
+}
+
+export function S_IG_NASA7_specialize(c: ArrayLike<number>): NASASpecializedKernel {
+  const s0 = R * c[0], s1 = R * c[1], s2 = (R * c[2]) / 2, s3 = (R * c[3]) / 3, s4 = (R * c[4]) / 4;
+  const s6 = R * c[6];
+  return (T) => s0 * Math.log(T) + s6 + T * (s1 + T * (s2 + T * (s3 + T * s4)));
+}
+
+export function GiFrEn_IG_NASA7_specialize(c: ArrayLike<number>): NASASpecializedKernel {
+  const g0 = R * c[0], g1 = (-R * c[1]) / 2, g2 = (-R * c[2]) / 6, g3 = (-R * c[3]) / 12, g4 = (-R * c[4]) / 20;
+  const g5 = R * c[5], g6 = -R * c[6];
+  return (T) => g5 + g0 * T * (1 - Math.log(T)) + T * (g6 + T * (g1 + T * (g2 + T * (g3 + T * g4))));
+}
+
+export function Cp_IG_NASA7_specialize(c: ArrayLike<number>): NASASpecializedKernel {
+  const c0 = R * c[0], c1 = R * c[1], c2 = R * c[2], c3 = R * c[3], c4 = R * c[4];
+  return (T) => c0 + T * (c1 + T * (c2 + T * (c3 + T * c4)));
+}
+
+// NOTE: specializer per generic kernel
+const SPECIALIZERS = new Map<NASAKernel, NASASpecializer>([
+  [En_IG_NASA9_kernel, En_IG_NASA9_specialize],
+  [S_IG_NASA9_kernel, S_IG_NASA9_specialize],
+  [GiFrEn_IG_NASA9_kernel, GiFrEn_IG_NASA9_specialize],
+  [Cp_IG_NASA9_kernel, Cp_IG_NASA9_specialize],
+  [En_IG_NASA7_kernel, En_IG_NASA7_specialize],
+  [S_IG_NASA7_kernel, S_IG_NASA7_specialize],
+  [GiFrEn_IG_NASA7_kernel, GiFrEn_IG_NASA7_specialize],
+  [Cp_IG_NASA7_kernel, Cp_IG_NASA7_specialize]
+]);
+
+// NOTE: specialize a generic kernel for a fixed coefficient vector (falls back to binding the vector)
+export function specializeKernel(kernel: NASAKernel, c: ArrayLike<number>): NASASpecializedKernel {
+  const specializer = SPECIALIZERS.get(kernel);
+  return specializer ? specializer(c) : (T) => kernel(T, c);
+}
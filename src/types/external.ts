@@ -41,6 +41,8 @@ export interface Source {
     component: Component;
     componentKey: ComponentKey | string;
     propName: NASARangeType;
+    // NOTE: precomputed id for (component, componentKey); skips rebuilding it per lookup
+    componentId?: string;
   }) => ComponentEquationSource | null | undefined;
 }
 
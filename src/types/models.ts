@@ -1,4 +1,4 @@
-import { StateType } from './constants';
+import { BasisType, StateType } from './constants';
 
 export interface Temperature {
   value: number;
@@ -20,6 +20,13 @@ export interface CustomProp {
   description?: string;
 }
 
+// NOTE: batch result; values stay a raw typed array, wrapped once at the API boundary
+export interface CustomPropArray {
+  values: Float64Array;
+  unit: string;
+  basis: BasisType;
+}
+
 export interface NASA7Coefficients {
   a1: number;
   a2: number;
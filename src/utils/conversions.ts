@@ -66,7 +66,8 @@ export function toJPerMolK(value: number, unit: string): number {
  * @returns - The custom property with value converted to the expected unit if necessary.
  */
 export function ensureEnergy(prop: CustomProp, expect: EnergyUnit = 'J/mol'): CustomProp {
-  if (normalize(prop.unit) === normalize(expect)) {
+  // NOTE: exact match first; internal results always carry the canonical spelling
+  if (prop.unit === expect || normalize(prop.unit) === normalize(expect)) {
     return prop;
   }
   return { ...prop, value: toJPerMol(prop.value, prop.unit), unit: 'J/mol' };
@@ -79,7 +80,8 @@ export function ensureEnergy(prop: CustomProp, expect: EnergyUnit = 'J/mol'): Cu
  * @returns The custom property with value converted to the expected unit if necessary.
  */
 export function ensureEntropy(prop: CustomProp, expect: EntropyUnit = 'J/mol.K'): CustomProp {
-  if (normalize(prop.unit) === normalize(expect)) {
+  // NOTE: exact match first; internal results always carry the canonical spelling
+  if (prop.unit === expect || normalize(prop.unit) === normalize(expect)) {
     return prop;
   }
   return { ...prop, value: toJPerMolK(prop.value, prop.unit), unit: 'J/mol.K' };
@@ -1,6 +1,13 @@
-import { NASARangeType, NASAType } from '@/types/constants';
-import { CustomProp, NASA7Coefficients, NASA9Coefficients, Temperature } from '@/types/models';
-import { energyOrEntropyToMassBasis, toKelvin } from './unitConverter';
+import {
+  NASARangeType,
+  NASAType,
+  TEMPERATURE_BREAK_NASA7_1000_K,
+  TEMPERATURE_BREAK_NASA7_6000_K,
+  TEMPERATURE_BREAK_NASA9_1000_K,
+  TEMPERATURE_BREAK_NASA9_6000_K
+} from '@/types/constants';
+import { CustomProp, CustomPropArray, NASA7Coefficients, NASA9Coefficients, Temperature } from '@/types/models';
+import { energyOrEntropyToMassBasis, energyOrEntropyToMassBasisBatch, toKelvin } from './unitConverter';
 
 const ENERGY_UNITS = new Set(['j', 'kj', 'cal', 'kcal']);
 
@@ -29,6 +36,78 @@ export function requireCoeffs<T extends object, K extends PropertyKey>(
   return subset;
 }
 
+/**
+ * Non-throwing variant of requireCoeffs; returns null when a required key is missing.
+ */
+export function pickCoeffs<T extends object, K extends PropertyKey>(
+  coeffs: T,
+  required: readonly K[]
+): Record<string, number> | null {
+  const subset: Record<string, number> = {};
+  for (const k of required) {
+    const value = (coeffs as any)[k];
+    if (value === undefined || value === null) return null;
+    const num = Number(value);
+    if (Number.isNaN(num)) return null;
+    subset[k as string] = num;
+  }
+  return subset;
+}
+
+/**
+ * Positional variant of pickCoeffs; returns the required coefficients in order as a Float64Array,
+ * or null when a required key is missing.
+ */
+export function pickCoeffsVector<T extends object, K extends PropertyKey>(
+  coeffs: T,
+  required: readonly K[]
+): Float64Array | null {
+  const vector = new Float64Array(required.length);
+  for (let i = 0; i < required.length; i++) {
+    const value = (coeffs as any)[required[i]];
+    if (value === undefined || value === null) return null;
+    const num = Number(value);
+    if (Number.isNaN(num)) return null;
+    vector[i] = num;
+  }
+  return vector;
+}
+
+/**
+ * NASA temperature breaks (K) per NASA type.
+ */
+export const NASA_TEMPERATURE_BREAKS_K: Readonly<Record<NASAType, readonly [number, number]>> = Object.freeze({
+  nasa7: Object.freeze([TEMPERATURE_BREAK_NASA7_1000_K, TEMPERATURE_BREAK_NASA7_6000_K] as const),
+  nasa9: Object.freeze([TEMPERATURE_BREAK_NASA9_1000_K, TEMPERATURE_BREAK_NASA9_6000_K] as const)
+});
+
+/**
+ * NASA ranges below, between and above the temperature breaks per NASA type.
+ */
+export const NASA_RANGES: Readonly<Record<NASAType, readonly [NASARangeType, NASARangeType, NASARangeType]>> = Object.freeze({
+  nasa7: Object.freeze(['nasa7_200_1000_K', 'nasa7_1000_6000_K', 'nasa7_6000_20000_K'] as const),
+  nasa9: Object.freeze(['nasa9_200_1000_K', 'nasa9_1000_6000_K', 'nasa9_6000_20000_K'] as const)
+});
+
+/**
+ * Select the NASA range index (0: low, 1: mid, 2: high) for a temperature in Kelvin.
+ */
+export function nasaRangeIndex(T_K: number, nasaType: NASAType): 0 | 1 | 2 {
+  const [Tmin, Tmax] = NASA_TEMPERATURE_BREAKS_K[nasaType];
+  return T_K <= Tmin ? 0 : T_K <= Tmax ? 1 : 2;
+}
+
+/**
+ * Select NASA range for a temperature in Kelvin against the NASA_TEMPERATURE_BREAKS_K table.
+ * Raw-number counterpart of selectNasaType for hot paths.
+ */
+export function selectNasaRangeK(T_K: number, nasaType: NASAType): NASARangeType {
+  if (Number.isNaN(T_K)) {
+    throw new Error(`Temperature ${T_K} K is out of expected range.`);
+  }
+  return NASA_RANGES[nasaType][nasaRangeIndex(T_K, nasaType)];
+}
+
 /**
  * Select NASA range based on temperature and nasa type.
  */
@@ -42,16 +121,12 @@ export function selectNasaType(
   const Tmin = toKelvin(breakTempMin);
   const Tmax = toKelvin(breakTempMax);
 
-  if (T <= Tmin) {
-    return nasaType === 'nasa7' ? 'nasa7_200_1000_K' : 'nasa9_200_1000_K';
-  }
-  if (T > Tmin && T <= Tmax) {
-    return nasaType === 'nasa7' ? 'nasa7_1000_6000_K' : 'nasa9_1000_6000_K';
+  if (Number.isNaN(T) || Number.isNaN(Tmin) || Number.isNaN(Tmax)) {
+    throw new Error(`Temperature ${T} K is out of expected range.`);
   }
-  if (T > Tmax) {
-    return nasaType === 'nasa7' ? 'nasa7_6000_20000_K' : 'nasa9_6000_20000_K';
-  }
-  throw new Error(`Temperature ${T} K is out of expected range.`);
+
+  // NOTE: two comparisons pick the bucket; the range name comes from the NASA_RANGES table
+  return NASA_RANGES[nasaType === 'nasa7' ? 'nasa7' : 'nasa9'][T <= Tmin ? 0 : T <= Tmax ? 1 : 2];
 }
 
 export function isNASA9(coeffs: Coefficients): coeffs is NASA9Coefficients {
@@ -65,6 +140,18 @@ export function toMassBasis(value: CustomProp, mw_g_per_mol: number): CustomProp
   return energyOrEntropyToMassBasis(value, mw_g_per_mol);
 }
 
+/**
+ * Normalize a batch of energy/entropy values sharing one unit to mass basis, parsing the unit once.
+ */
+export function toMassBasisBatch(
+  values: ArrayLike<number>,
+  unit: string,
+  mw_g_per_mol: number | ArrayLike<number>,
+  out?: Float64Array
+): CustomPropArray {
+  return energyOrEntropyToMassBasisBatch(values, unit, mw_g_per_mol, out);
+}
+
 /**
  * Quick check for supported energy unit strings.
  */
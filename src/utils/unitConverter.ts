@@ -1,4 +1,4 @@
-import { CustomProp, Temperature } from '@/types';
+import { CustomProp, CustomPropArray, Temperature } from '@/types';
 
 export type SupportedTempUnit = Temperature['unit'];
 
@@ -13,6 +13,8 @@ const toKelvinMap: Record<SupportedTempUnit, (value: number) => number> = {
  * Convert a temperature to Kelvin.
  */
 export function toKelvin(temp: Temperature): number {
+  // NOTE: most temperatures are already Kelvin; skip the converter lookup
+  if (temp.unit === 'K') return temp.value;
   const converter = toKelvinMap[temp.unit];
   if (!converter) {
     throw new Error(`Unsupported temperature unit: ${temp.unit}`);
@@ -20,6 +22,11 @@ export function toKelvin(temp: Temperature): number {
   return converter(temp.value);
 }
 
+// NOTE: parsed molar units keyed by the raw unit string; only units that parse are stored,
+// so the table is bounded by the few valid spellings callers actually use
+type MassBasisUnit = { amount: 'mol' | 'kmol'; massUnit: string };
+const MASS_BASIS_UNITS = new Map<string, MassBasisUnit>();
+
 /**
  * Convert energy or entropy to a mass basis while preserving energy unit casing.
  * Accepts J/mol, kJ/kmol, J/mol.K, kJ/kmol.K (dot before K is required).
@@ -32,7 +39,56 @@ export function energyOrEntropyToMassBasis(
     throw new Error(`mw must be > 0 (got ${mw_g_per_mol})`);
   }
 
-  const unitRaw = value.unit.trim();
+  let parsed = MASS_BASIS_UNITS.get(value.unit);
+  if (!parsed) {
+    parsed = parseMassBasisUnit(value.unit);
+    MASS_BASIS_UNITS.set(value.unit, parsed);
+  }
+
+  let massValue: number;
+  if (parsed.amount === 'mol') {
+    const mw_kg_per_mol = mw_g_per_mol / 1000;
+    massValue = value.value / mw_kg_per_mol;
+  } else {
+    const mw_kg_per_kmol = mw_g_per_mol; // g/mol == kg/kmol numerically
+    massValue = value.value / mw_kg_per_kmol;
+  }
+
+  return { ...value, value: massValue, unit: parsed.massUnit };
+}
+
+/**
+ * Convert a batch of energy or entropy values sharing one unit to a mass basis.
+ * The unit is parsed once; mw_g_per_mol is either one weight for all values or one weight per value.
+ */
+export function energyOrEntropyToMassBasisBatch(
+  values: ArrayLike<number>,
+  unit: string,
+  mw_g_per_mol: number | ArrayLike<number>,
+  out: Float64Array = new Float64Array(values.length)
+): CustomPropArray {
+  let parsed = MASS_BASIS_UNITS.get(unit);
+  if (!parsed) {
+    parsed = parseMassBasisUnit(unit);
+    MASS_BASIS_UNITS.set(unit, parsed);
+  }
+
+  const scalar = typeof mw_g_per_mol === 'number';
+  for (let i = 0; i < values.length; i++) {
+    const mw = scalar ? mw_g_per_mol : mw_g_per_mol[i];
+    if (mw <= 0) {
+      throw new Error(`mw must be > 0 (got ${mw})`);
+    }
+    // NOTE: g/mol == kg/kmol numerically
+    out[i] = parsed.amount === 'mol' ? values[i] / (mw / 1000) : values[i] / mw;
+  }
+
+  return { values: out, unit: parsed.massUnit, basis: 'mass' };
+}
+
+// NOTE: parse a molar energy/entropy unit into its amount and mass-basis unit (throws on unsupported units)
+function parseMassBasisUnit(unit: string): MassBasisUnit {
+  const unitRaw = unit.trim();
   const unitNorm = unitRaw.toLowerCase().replace(/\s+/g, '');
 
   const match = unitNorm.match(
@@ -40,24 +96,14 @@ export function energyOrEntropyToMassBasis(
   );
   if (!match) {
     throw new Error(
-      `Unsupported or invalid unit format: '${value.unit}'. ` +
+      `Unsupported or invalid unit format: '${unit}'. ` +
         "Use 'J/mol', 'kJ/kmol', 'J/mol.K', or 'kJ/kmol.K'"
     );
   }
 
-  const amount = match[2]; // mol or kmol
+  const amount = match[2] as 'mol' | 'kmol';
   const hasK = Boolean(match[3]);
-
-  let massValue: number;
-  if (amount === 'mol') {
-    const mw_kg_per_mol = mw_g_per_mol / 1000;
-    massValue = value.value / mw_kg_per_mol;
-  } else {
-    const mw_kg_per_kmol = mw_g_per_mol; // g/mol == kg/kmol numerically
-    massValue = value.value / mw_kg_per_kmol;
-  }
-
   const massUnit = hasK ? `${unitRaw.split('/')[0].trim()}/kg.K` : `${unitRaw.split('/')[0].trim()}/kg`;
 
-  return { ...value, value: massValue, unit: massUnit };
+  return { amount, massUnit };
 }
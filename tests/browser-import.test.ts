@@ -29,9 +29,18 @@ describe('browser bundle import', () => {
     expect(typeof browser.S_T_series).toBe('function');
     expect(typeof browser.G_T_series).toBe('function');
     expect(typeof browser.Cp_T_series).toBe('function');
+    expect(typeof browser.H_T_batch).toBe('function');
+    expect(typeof browser.S_T_batch).toBe('function');
+    expect(typeof browser.G_T_batch).toBe('function');
+    expect(typeof browser.Cp_T_batch).toBe('function');
+    expect(typeof browser.HSCp_T).toBe('function');
+    expect(typeof browser.dG_rxn_STD_batch).toBe('function');
+    expect(typeof browser.Keq_curve).toBe('function');
+    expect(typeof browser.Keq_vh_shortcut_curve).toBe('function');
     expect(typeof browser.dG_rxn_STD_series).toBe('function');
     expect(typeof browser.dS_rxn_STD_series).toBe('function');
     expect(typeof browser.dH_rxn_STD_series).toBe('function');
     expect(typeof browser.Keq_series).toBe('function');
+    expect(typeof browser.Keq_vh_shortcut_series).toBe('function');
   });
 });
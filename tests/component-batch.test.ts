@@ -0,0 +1,100 @@
+import { beforeAll, describe, expect, it } from 'vitest';
+import { Cp_T, Cp_T_batch, G_T, G_T_batch, H_T, H_T_batch, HSCp_T, S_T, S_T_batch } from '../src/app';
+import type { ModelSource } from '../src/types/external';
+import type { Temperature } from '../src/types/models';
+import { CO2, H2, H2O, MISSING, expectClose, loadExampleModelSource } from './fixtures/modelSource';
+
+// NOTE: spans both NASA breaks, with points just either side of 1000 K
+const TEMPERATURES_K = [250, 298.15, 999.9999, 1000, 1000.0001, 3000, 6000, 6500];
+const INVALID_K = [0, -3, NaN, Infinity];
+
+let model_source: ModelSource;
+beforeAll(async () => {
+  model_source = await loadExampleModelSource();
+});
+
+const PAIRS = [
+  ['H_T_batch', H_T_batch, H_T],
+  ['S_T_batch', S_T_batch, S_T],
+  ['G_T_batch', G_T_batch, G_T],
+  ['Cp_T_batch', Cp_T_batch, Cp_T]
+] as const;
+
+describe('component batch APIs match their scalar counterparts', () => {
+  for (const [name, batch, scalar] of PAIRS) {
+    for (const basis of ['molar', 'mass'] as const) {
+      it(`${name} (${basis}) equals the scalar call element-wise`, () => {
+        for (const component of [H2, H2O, CO2]) {
+          const res = batch({ component, temperatures_K: TEMPERATURES_K, model_source, basis });
+          expect(res).not.toBeNull();
+          expect(res!.values).toHaveLength(TEMPERATURES_K.length);
+          expect(res!.basis).toBe(basis);
+
+          TEMPERATURES_K.forEach((T, i) => {
+            const expected = scalar({ component, temperature: { value: T, unit: 'K' }, model_source, basis });
+            expect(expected).not.toBeNull();
+            expect(res!.unit).toBe(expected!.unit);
+            expectClose(res!.values[i], expected!.value);
+          });
+        }
+      });
+    }
+
+    it(`${name} returns NaN for invalid temperatures`, () => {
+      const res = batch({ component: H2O, temperatures_K: [500, ...INVALID_K], model_source });
+      expect(Number.isFinite(res!.values[0])).toBe(true);
+      INVALID_K.forEach((_, i) => expect(res!.values[i + 1]).toBeNaN());
+    });
+
+    it(`${name} accepts a Float64Array and an empty array`, () => {
+      const typed = batch({ component: H2O, temperatures_K: Float64Array.from(TEMPERATURES_K), model_source });
+      const plain = batch({ component: H2O, temperatures_K: TEMPERATURES_K, model_source });
+      expect(Array.from(typed!.values)).toEqual(Array.from(plain!.values));
+      expect(batch({ component: H2O, temperatures_K: [], model_source })!.values).toHaveLength(0);
+    });
+
+    it(`${name} returns null for a missing component`, () => {
+      expect(batch({ component: MISSING, temperatures_K: TEMPERATURES_K, model_source })).toBeNull();
+    });
+  }
+});
+
+describe('HSCp_T matches the single-property APIs', () => {
+  // NOTE: one temperature per NASA range (dihydrogen has its own 6000-20000 K record in the fixture)
+  const RANGE_TEMPERATURES_K = [500, 3000, 6500];
+  const SCALARS = [
+    ['H', H_T],
+    ['S', S_T],
+    ['G', G_T],
+    ['Cp', Cp_T]
+  ] as const;
+
+  for (const basis of ['molar', 'mass'] as const) {
+    it(`returns H, S, G and Cp equal to H_T/S_T/G_T/Cp_T (${basis})`, () => {
+      for (const component of [H2, H2O, CO2]) {
+        for (const T of RANGE_TEMPERATURES_K) {
+          const temperature: Temperature = { value: T, unit: 'K' };
+          const all = HSCp_T({ component, temperature, model_source, basis });
+          expect(all).not.toBeNull();
+          for (const [key, scalar] of SCALARS) {
+            const expected = scalar({ component, temperature, model_source, basis })!;
+            expect(all![key].unit).toBe(expected.unit);
+            expectClose(all![key].value, expected.value);
+          }
+        }
+      }
+    });
+  }
+
+  it('keeps earlier results intact across calls', () => {
+    const first = HSCp_T({ component: H2O, temperature: { value: 500, unit: 'K' }, model_source })!;
+    const snapshot = JSON.stringify(first);
+    HSCp_T({ component: H2O, temperature: { value: 3000, unit: 'K' }, model_source });
+    expect(JSON.stringify(first)).toBe(snapshot);
+  });
+
+  it('returns null for a missing component or an invalid temperature', () => {
+    expect(HSCp_T({ component: MISSING, temperature: { value: 500, unit: 'K' }, model_source })).toBeNull();
+    expect(HSCp_T({ component: H2O, temperature: { value: -3, unit: 'K' }, model_source })).toBeNull();
+  });
+});
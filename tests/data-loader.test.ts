@@ -0,0 +1,39 @@
+import { describe, expect, it } from 'vitest';
+import { mkdtemp, readdir, readFile, rm, writeFile } from 'node:fs/promises';
+import os from 'node:os';
+import path from 'node:path';
+import { loadModelSource, RangeFile } from '../scripts/DataLoader';
+
+const EXAMPLES_DIR = path.resolve(__dirname, '..', 'examples');
+const RANGE_FILES: RangeFile[] = [
+  { path: path.join(EXAMPLES_DIR, 'gas_nasa9_coeffs_min_0_max_1000.csv'), range: 'nasa9_200_1000_K' },
+  { path: path.join(EXAMPLES_DIR, 'gas_nasa9_coeffs_min_1000_max_6000.csv'), range: 'nasa9_1000_6000_K' }
+];
+
+describe('DataLoader cache', () => {
+  it('round-trips the ModelSource and keeps records shared across component ids', async () => {
+    const cacheDir = await mkdtemp(path.join(os.tmpdir(), 'nasa-cache-'));
+    try {
+      const parsed = await loadModelSource(RANGE_FILES, { cacheDir });
+      const [cacheFile] = await readdir(cacheDir);
+      const cache = JSON.parse(await readFile(path.join(cacheDir, cacheFile), 'utf-8'));
+
+      // NOTE: one persisted record per CSV row and range, not one per component id
+      const rowCount = new Set(Object.values(parsed).flatMap((ranges) => Object.values(ranges))).size;
+      expect(cache.records).toHaveLength(rowCount);
+
+      const cached = await loadModelSource(RANGE_FILES, { cacheDir });
+      expect(cached).toEqual(parsed);
+      expect(cached['dihydrogen-H2']).toBeDefined();
+      expect(cached['H2-g'].nasa9_200_1000_K).toBe(cached['dihydrogen-H2'].nasa9_200_1000_K);
+
+      // NOTE: a later load is served from the cache file
+      cache.records.forEach((record: { MW: number }) => (record.MW = 999));
+      await writeFile(path.join(cacheDir, cacheFile), JSON.stringify(cache), 'utf-8');
+      const reloaded = await loadModelSource(RANGE_FILES, { cacheDir });
+      expect(reloaded['H2-g'].nasa9_200_1000_K!.MW).toBe(999);
+    } finally {
+      await rm(cacheDir, { recursive: true, force: true });
+    }
+  });
+});
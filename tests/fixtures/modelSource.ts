@@ -0,0 +1,47 @@
+import path from 'node:path';
+import { loadModelSource } from '../../scripts/DataLoader';
+import { setComponentId } from '../../src/utils/component';
+import type { ComponentKey, NASARangeType } from '../../src/types/constants';
+import type { ModelSource } from '../../src/types/external';
+import type { Component } from '../../src/types/models';
+
+const EXAMPLES_DIR = path.resolve(__dirname, '..', '..', 'examples');
+const COMPONENT_KEYS: ComponentKey[] = ['Name-State', 'Formula-State', 'Name-Formula', 'Name-Formula-State', 'Formula-Name-State'];
+
+export const H2: Component = { name: 'dihydrogen', formula: 'H2', state: 'g' };
+export const O2: Component = { name: 'dioxygen', formula: 'O2', state: 'g' };
+export const H2O: Component = { name: 'dihydrogen monoxide', formula: 'H2O', state: 'g' };
+export const CO: Component = { name: 'carbon monoxide', formula: 'CO', state: 'g' };
+export const CO2: Component = { name: 'carbon dioxide', formula: 'CO2', state: 'g' };
+export const MISSING: Component = { name: 'unobtainium', formula: 'Ub', state: 'g' };
+
+// NOTE: copy a component's record from one range into another under every component key
+function setRange(model_source: ModelSource, component: Component, from: NASARangeType, to: NASARangeType, patch: object): void {
+  for (const componentKey of COMPONENT_KEYS) {
+    const ranges = model_source[setComponentId({ component, componentKey })];
+    ranges[to] = { ...ranges[from]!, ...patch } as any;
+  }
+}
+
+/**
+ * Bundled NASA9 example data. The 6000-20000 K CSV is empty, so ranges above 6000 K fall back to the
+ * 1000-6000 K records; dihydrogen gets its own (copied) high range, and carbon monoxide an invalid one
+ * (b1 missing), so it has no data above 6000 K.
+ */
+export async function loadExampleModelSource(): Promise<ModelSource> {
+  const model_source = await loadModelSource([
+    { path: path.join(EXAMPLES_DIR, 'gas_nasa9_coeffs_min_0_max_1000.csv'), range: 'nasa9_200_1000_K' },
+    { path: path.join(EXAMPLES_DIR, 'gas_nasa9_coeffs_min_1000_max_6000.csv'), range: 'nasa9_1000_6000_K' },
+    { path: path.join(EXAMPLES_DIR, 'gas_nasa9_coeffs_min_6000_max_20000.csv'), range: 'nasa9_6000_20000_K' }
+  ]);
+  setRange(model_source, H2, 'nasa9_1000_6000_K', 'nasa9_6000_20000_K', { Tmin: 6000, Tmax: 20000, a6: 1.5 });
+  setRange(model_source, CO, 'nasa9_1000_6000_K', 'nasa9_6000_20000_K', { Tmin: 6000, Tmax: 20000, b1: undefined });
+  return model_source;
+}
+
+// NOTE: relative closeness for values computed along different code paths
+export function expectClose(actual: number, expected: number, rel = 1e-9): void {
+  if (Math.abs(actual - expected) > rel * Math.max(1, Math.abs(expected))) {
+    throw new Error(`expected ${actual} to be close to ${expected}`);
+  }
+}
@@ -0,0 +1,194 @@
+import { beforeAll, describe, expect, it } from 'vitest';
+import { HSGs } from '../src/core/HSGs';
+import { Source } from '../src/core/Source';
+import type { ModelSource } from '../src/types/external';
+import type { Component, Temperature } from '../src/types/models';
+import { CO, CO2, H2, H2O, MISSING, O2, loadExampleModelSource } from './fixtures/modelSource';
+
+const COMPONENTS: Component[] = [H2, O2, H2O, CO, CO2];
+const PROPS = ['enthalpy', 'entropy', 'gibbs', 'heat_capacity'] as const;
+
+let model_source: ModelSource;
+beforeAll(async () => {
+  model_source = await loadExampleModelSource();
+});
+
+function buildHSGs(): HSGs {
+  return new HSGs(new Source(model_source, 'Name-Formula'), COMPONENTS, 'Name-Formula', 'nasa9');
+}
+
+describe('HSGs single-temperature APIs', () => {
+  it('return null for invalid temperatures instead of throwing', () => {
+    const hsgs = buildHSGs();
+    for (const value of [NaN, 0, -3, Infinity]) {
+      const temperature: Temperature = { value, unit: 'K' };
+      expect(hsgs.calc_components_hsg(temperature, 'enthalpy')).toBeNull();
+      expect(hsgs.calc_components_hsg_multi(temperature, PROPS)).toBeNull();
+      expect(hsgs.calc_components_hsg_vec(temperature, 'gibbs')).toBeNull();
+      expect(hsgs.calc_components_hsg_vec_multi(temperature, PROPS)).toBeNull();
+      expect(hsgs.calc_components_hsg_ordered(temperature, 'entropy')).toBeNull();
+      expect(hsgs.calc_components_hsg_ordered_multi(temperature, PROPS)).toBeNull();
+    }
+  });
+});
+
+describe('HSGs.calc_components_hsg_vec_multi', () => {
+  it('matches calc_components_hsg_vec per property', () => {
+    const hsgs = buildHSGs();
+    for (const value of [298.15, 3000, 6500]) {
+      const temperature: Temperature = { value, unit: 'K' };
+      const multi = hsgs.calc_components_hsg_vec_multi(temperature, PROPS);
+      expect(multi).not.toBeNull();
+      for (const prop of PROPS) {
+        const single = hsgs.calc_components_hsg_vec(temperature, prop)!;
+        expect(multi!.reaction_ids).toEqual(single.reaction_ids);
+        expect(Array.from(multi!.values[prop])).toEqual(Array.from(single.values));
+      }
+    }
+  });
+});
+
+describe('HSGs.tabulate / calc_components_hsg_interp', () => {
+  // NOTE: 10 K grid from 300 K to 9000 K; 1000 K and 6000 K are grid points on the low side of each break
+  // (tolerances are relative with a 1000 J/mol floor, since H crosses zero near 298 K)
+  const GRID_K = Array.from({ length: 871 }, (_, i) => 300 + i * 10);
+  const at = (value: number): Temperature => ({ value, unit: 'K' });
+
+  function expectSame(actual: Record<string, { value: number; unit: string }> | null, expected: Record<string, { value: number; unit: string }> | null, rel: number): void {
+    expect(actual).not.toBeNull();
+    expect(Object.keys(actual!)).toEqual(Object.keys(expected!));
+    for (const [key, { value, unit }] of Object.entries(expected!)) {
+      expect(actual![key].unit).toBe(unit);
+      expect(Math.abs(actual![key].value - value)).toBeLessThanOrEqual(rel * Math.max(1000, Math.abs(value)));
+    }
+  }
+
+  it('is exact at grid nodes', () => {
+    const hsgs = buildHSGs();
+    hsgs.tabulate(GRID_K);
+    for (const prop of PROPS) {
+      for (const T of [300, 500, 1000, 1010, 2500, 6000, 6010, 9000]) {
+        expectSame(hsgs.calc_components_hsg_interp(at(T), prop), hsgs.calc_components_hsg(at(T), prop), 1e-12);
+      }
+    }
+  });
+
+  it('stays within tolerance mid-cell', () => {
+    const hsgs = buildHSGs();
+    hsgs.tabulate(GRID_K);
+    for (const prop of PROPS) {
+      for (const T of [305, 777.7, 1505, 4321, 7005]) {
+        expectSame(hsgs.calc_components_hsg_interp(at(T), prop), hsgs.calc_components_hsg(at(T), prop), 1e-4);
+      }
+    }
+  });
+
+  it('does not interpolate across the 1000 K and 6000 K breaks', () => {
+    const hsgs = buildHSGs();
+    hsgs.tabulate(GRID_K);
+    // NOTE: 1000.5 K and 6000.5 K lie before the first grid point of their range, so they are computed exactly
+    for (const T of [1000.5, 6000.5]) {
+      for (const prop of PROPS) {
+        expectSame(hsgs.calc_components_hsg_interp(at(T), prop), hsgs.calc_components_hsg(at(T), prop), 1e-12);
+      }
+    }
+  });
+
+  it('falls back to calc_components_hsg outside the grid', () => {
+    const hsgs = buildHSGs();
+    hsgs.tabulate(GRID_K);
+    for (const T of [250, 9500]) {
+      expectSame(
+        hsgs.calc_components_hsg_interp(at(T), 'enthalpy', { reaction_ids: true }),
+        hsgs.calc_components_hsg(at(T), 'enthalpy', { reaction_ids: true }),
+        1e-12
+      );
+    }
+  });
+
+  it('replaces earlier tables on re-tabulate', () => {
+    const hsgs = buildHSGs();
+    const exact = hsgs.calc_components_hsg(at(350), 'gibbs')!;
+
+    hsgs.tabulate([300, 400]);
+    const interpolated = hsgs.calc_components_hsg_interp(at(350), 'gibbs')!;
+    expect(interpolated['dihydrogen-H2'].value).not.toBe(exact['dihydrogen-H2'].value);
+
+    hsgs.tabulate([500, 600]);
+    expectSame(hsgs.calc_components_hsg_interp(at(350), 'gibbs'), exact, 1e-12);
+  });
+
+  it('returns null for T <= 0', () => {
+    const hsgs = buildHSGs();
+    hsgs.tabulate(GRID_K);
+    for (const T of [0, -3, NaN]) {
+      expect(hsgs.calc_components_hsg_interp(at(T), 'enthalpy')).toBeNull();
+    }
+  });
+});
+
+describe('HSGs.calc_components_hsg_sweep', () => {
+  // NOTE: unsorted, spans all three NASA ranges, with invalid entries mixed in
+  const TEMPERATURES_K = [6500, 300, NaN, 1000, 3000, -5, 999.5, 8000, 0, 1000.0001, 6000];
+
+  for (const reaction_ids of [false, true]) {
+    it(`matches calc_components_hsg per temperature (reaction_ids: ${reaction_ids})`, () => {
+      const hsgs = buildHSGs();
+      for (const prop of PROPS) {
+        const sweep = hsgs.calc_components_hsg_sweep(TEMPERATURES_K, prop, { reaction_ids });
+        expect(sweep).not.toBeNull();
+
+        TEMPERATURES_K.forEach((T, i) => {
+          const valid = Number.isFinite(T) && T > 0;
+          const exact = valid ? hsgs.calc_components_hsg({ value: T, unit: 'K' }, prop, { reaction_ids }) : null;
+          for (const [key, column] of Object.entries(sweep!.values)) {
+            expect(column).toHaveLength(TEMPERATURES_K.length);
+            if (!exact || !exact[key]) {
+              expect(column[i]).toBeNaN();
+              continue;
+            }
+            expect(sweep!.unit).toBe(exact[key].unit);
+            expect(column[i]).toBeCloseTo(exact[key].value, 6);
+          }
+        });
+      }
+    });
+  }
+
+  it('keys by component id or reaction id', () => {
+    const hsgs = buildHSGs();
+    const by_component = hsgs.calc_components_hsg_sweep([500], 'enthalpy')!;
+    const by_reaction = hsgs.calc_components_hsg_sweep([500], 'enthalpy', { reaction_ids: true })!;
+    expect(Object.keys(by_component.values).sort()).toEqual(
+      ['carbon dioxide-CO2', 'carbon monoxide-CO', 'dihydrogen monoxide-H2O', 'dihydrogen-H2', 'dioxygen-O2']
+    );
+    expect(Object.keys(by_reaction.values).sort()).toEqual(['CO-g', 'CO2-g', 'H2-g', 'H2O-g', 'O2-g']);
+    expect(by_reaction.values['CO-g'][0]).toBe(by_component.values['carbon monoxide-CO'][0]);
+  });
+
+  it('leaves NaN in the column of a component without data in a range', () => {
+    const hsgs = buildHSGs();
+    const sweep = hsgs.calc_components_hsg_sweep([3000, 6500], 'heat_capacity', { reaction_ids: true })!;
+    expect(Number.isFinite(sweep.values['CO-g'][0])).toBe(true);
+    expect(sweep.values['CO-g'][1]).toBeNaN();
+    expect(Number.isFinite(sweep.values['H2-g'][1])).toBe(true);
+  });
+
+  it('returns NaN-filled or empty columns for invalid or empty input', () => {
+    const hsgs = buildHSGs();
+    const invalid = hsgs.calc_components_hsg_sweep([NaN, -1], 'enthalpy')!;
+    expect(Object.keys(invalid.values)).toHaveLength(COMPONENTS.length);
+    for (const column of Object.values(invalid.values)) {
+      expect(column[0]).toBeNaN();
+      expect(column[1]).toBeNaN();
+    }
+    const empty = hsgs.calc_components_hsg_sweep([], 'enthalpy')!;
+    for (const column of Object.values(empty.values)) expect(column).toHaveLength(0);
+  });
+
+  it('returns null when no component has data and for unknown properties', () => {
+    const hsgs = new HSGs(new Source(model_source, 'Name-Formula'), [MISSING], 'Name-Formula', 'nasa9');
+    expect(hsgs.calc_components_hsg_sweep([500], 'enthalpy')).toBeNull();
+    expect(buildHSGs().calc_components_hsg_sweep([500], 'bogus' as never)).toBeNull();
+  });
+});
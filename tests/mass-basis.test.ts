@@ -0,0 +1,46 @@
+import { describe, expect, it } from 'vitest';
+import { energyOrEntropyToMassBasis, energyOrEntropyToMassBasisBatch } from '../src/utils/unitConverter';
+import { toMassBasisBatch } from '../src/utils/tools';
+
+const VALUES = [-241826.5, 0, 188.8, 1.5e6];
+const MWS = [18.015, 2.016, 31.998, 44.0095];
+const UNITS = ['J/mol', 'kJ/kmol', 'J/mol.K', ' kJ/kmol.K '];
+
+describe('mass-basis batch conversion', () => {
+  for (const convert of [energyOrEntropyToMassBasisBatch, toMassBasisBatch]) {
+    for (const unit of UNITS) {
+      it(`${convert.name} matches the scalar conversion for '${unit}' with one MW`, () => {
+        const res = convert(VALUES, unit, 18.015);
+        expect(res.basis).toBe('mass');
+        VALUES.forEach((value, i) => {
+          const expected = energyOrEntropyToMassBasis({ value, unit }, 18.015);
+          expect(res.unit).toBe(expected.unit);
+          expect(res.values[i]).toBe(expected.value);
+        });
+      });
+
+      it(`${convert.name} matches the scalar conversion for '${unit}' with one MW per value`, () => {
+        const res = convert(VALUES, unit, Float64Array.from(MWS));
+        VALUES.forEach((value, i) => {
+          const expected = energyOrEntropyToMassBasis({ value, unit }, MWS[i]);
+          expect(res.unit).toBe(expected.unit);
+          expect(res.values[i]).toBe(expected.value);
+        });
+      });
+    }
+
+    it(`${convert.name} converts in place when out aliases the input`, () => {
+      const values = Float64Array.from(VALUES);
+      const res = convert(values, 'J/mol', 18.015, values);
+      expect(res.values).toBe(values);
+      expect(values[0]).toBe(energyOrEntropyToMassBasis({ value: VALUES[0], unit: 'J/mol' }, 18.015).value);
+    });
+
+    it(`${convert.name} throws for mw <= 0 and unsupported units`, () => {
+      expect(() => convert(VALUES, 'J/mol', 0)).toThrow('mw must be > 0');
+      expect(() => convert(VALUES, 'J/mol', -1)).toThrow('mw must be > 0');
+      expect(() => convert(VALUES, 'J/mol', [18.015, 0, 31.998, 44.0095])).toThrow('mw must be > 0');
+      expect(() => convert(VALUES, 'J/g', 18.015)).toThrow('Unsupported or invalid unit format');
+    });
+  }
+});
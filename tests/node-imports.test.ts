@@ -33,10 +33,19 @@ describe('node imports from built artifacts', () => {
     expect(typeof cjs.S_T_series).toBe('function');
     expect(typeof cjs.G_T_series).toBe('function');
     expect(typeof cjs.Cp_T_series).toBe('function');
+    expect(typeof cjs.H_T_batch).toBe('function');
+    expect(typeof cjs.S_T_batch).toBe('function');
+    expect(typeof cjs.G_T_batch).toBe('function');
+    expect(typeof cjs.Cp_T_batch).toBe('function');
+    expect(typeof cjs.HSCp_T).toBe('function');
+    expect(typeof cjs.dG_rxn_STD_batch).toBe('function');
+    expect(typeof cjs.Keq_curve).toBe('function');
+    expect(typeof cjs.Keq_vh_shortcut_curve).toBe('function');
     expect(typeof cjs.dG_rxn_STD_series).toBe('function');
     expect(typeof cjs.dS_rxn_STD_series).toBe('function');
     expect(typeof cjs.dH_rxn_STD_series).toBe('function');
     expect(typeof cjs.Keq_series).toBe('function');
+    expect(typeof cjs.Keq_vh_shortcut_series).toBe('function');
   });
 
   it('loads ESM bundle and exposes key APIs', async () => {
@@ -67,9 +76,18 @@ describe('node imports from built artifacts', () => {
     expect(typeof esm.S_T_series).toBe('function');
     expect(typeof esm.G_T_series).toBe('function');
     expect(typeof esm.Cp_T_series).toBe('function');
+    expect(typeof esm.H_T_batch).toBe('function');
+    expect(typeof esm.S_T_batch).toBe('function');
+    expect(typeof esm.G_T_batch).toBe('function');
+    expect(typeof esm.Cp_T_batch).toBe('function');
+    expect(typeof esm.HSCp_T).toBe('function');
+    expect(typeof esm.dG_rxn_STD_batch).toBe('function');
+    expect(typeof esm.Keq_curve).toBe('function');
+    expect(typeof esm.Keq_vh_shortcut_curve).toBe('function');
     expect(typeof esm.dG_rxn_STD_series).toBe('function');
     expect(typeof esm.dS_rxn_STD_series).toBe('function');
     expect(typeof esm.dH_rxn_STD_series).toBe('function');
     expect(typeof esm.Keq_series).toBe('function');
+    expect(typeof esm.Keq_vh_shortcut_series).toBe('function');
   });
 });
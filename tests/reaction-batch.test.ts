@@ -0,0 +1,135 @@
+import { beforeAll, describe, expect, it, vi } from 'vitest';
+import {
+  Keq,
+  Keq_curve,
+  Keq_vh_shortcut,
+  Keq_vh_shortcut_curve,
+  Keq_vh_shortcut_series,
+  dG_rxn_STD,
+  dG_rxn_STD_batch
+} from '../src/app';
+import { RXNAdapter } from '../src/reactions/RXNAdapter';
+import type { ModelSource, Reaction } from '../src/types/external';
+import type { Temperature } from '../src/types/models';
+import { CO, CO2, H2, H2O, MISSING, O2, expectClose, loadExampleModelSource } from './fixtures/modelSource';
+
+const TEMPERATURES_K = [6500, 250, 298.15, 1000, 1000.0001, 3000, 6000];
+
+const water_formation: Reaction = {
+  name: 'water-formation-gas',
+  reaction: '2 H2(g) + O2(g) => 2 H2O(g)',
+  components: [H2, O2, H2O]
+};
+// NOTE: carbon monoxide has no data above 6000 K in the fixture
+const water_gas_shift: Reaction = {
+  name: 'water-gas-shift',
+  reaction: 'CO(g) + H2O(g) => CO2(g) + H2(g)',
+  components: [CO, H2O, CO2, H2]
+};
+const missing_component: Reaction = {
+  name: 'missing-component',
+  reaction: 'Ub(g) + O2(g) => CO2(g)',
+  components: [MISSING, O2, CO2]
+};
+
+let model_source: ModelSource;
+beforeAll(async () => {
+  model_source = await loadExampleModelSource();
+});
+
+const PAIRS = [
+  ['dG_rxn_STD_batch', dG_rxn_STD_batch, dG_rxn_STD],
+  ['Keq_curve', Keq_curve, Keq]
+] as const;
+
+describe('reaction batch APIs match their scalar counterparts', () => {
+  for (const [name, batch, scalar] of PAIRS) {
+    it(`${name} equals the scalar call per temperature`, () => {
+      for (const reaction of [water_formation, water_gas_shift]) {
+        const res = batch({ reaction, temperatures_K: TEMPERATURES_K, model_source });
+        expect(res).not.toBeNull();
+        expect(res!.values).toHaveLength(TEMPERATURES_K.length);
+
+        TEMPERATURES_K.forEach((T, i) => {
+          const expected = scalar({ reaction, temperature: { value: T, unit: 'K' }, model_source });
+          if (expected === null) {
+            expect(res!.values[i]).toBeNaN();
+            return;
+          }
+          expect(res!.unit).toBe(expected.unit);
+          expectClose(res!.values[i], expected.value, 1e-8);
+        });
+      }
+    });
+
+    it(`${name} gives NaN above 6000 K when a component has no data there`, () => {
+      const res = batch({ reaction: water_gas_shift, temperatures_K: [3000, 6500], model_source });
+      expect(Number.isFinite(res!.values[0])).toBe(true);
+      expect(res!.values[1]).toBeNaN();
+    });
+
+    it(`${name} returns empty or NaN-filled arrays for empty or invalid input`, () => {
+      expect(batch({ reaction: water_formation, temperatures_K: [], model_source })!.values).toHaveLength(0);
+      for (const T of [-3, 0, NaN]) {
+        const res = batch({ reaction: water_formation, temperatures_K: [T], model_source });
+        expect(res).not.toBeNull();
+        expect(res!.values[0]).toBeNaN();
+      }
+      const mixed = batch({ reaction: water_formation, temperatures_K: [500, -3], model_source });
+      expect(Number.isFinite(mixed!.values[0])).toBe(true);
+      expect(mixed!.values[1]).toBeNaN();
+    });
+
+    it(`${name} returns null when reaction data is missing`, () => {
+      expect(batch({ reaction: missing_component, temperatures_K: [500], model_source })).toBeNull();
+      expect(batch({ reaction: missing_component, temperatures_K: [], model_source })).toBeNull();
+    });
+  }
+});
+
+describe('Keq_vh_shortcut_curve', () => {
+  it('equals the scalar Keq_vh_shortcut per temperature', () => {
+    const res = Keq_vh_shortcut_curve({ reaction: water_formation, temperatures_K: TEMPERATURES_K, model_source });
+    expect(res).not.toBeNull();
+    TEMPERATURES_K.forEach((T, i) => {
+      const expected = Keq_vh_shortcut({ reaction: water_formation, temperature: { value: T, unit: 'K' }, model_source });
+      expect(res!.unit).toBe(expected!.unit);
+      expectClose(res!.values[i], expected!.value, 1e-8);
+    });
+  });
+
+  it('returns NaN for invalid temperatures and an empty array for empty input', () => {
+    const res = Keq_vh_shortcut_curve({ reaction: water_formation, temperatures_K: [500, 0, -3, NaN, Infinity], model_source });
+    expect(Number.isFinite(res!.values[0])).toBe(true);
+    for (let i = 1; i < 5; i++) expect(res!.values[i]).toBeNaN();
+    expect(Keq_vh_shortcut_curve({ reaction: water_formation, temperatures_K: [], model_source })!.values).toHaveLength(0);
+  });
+
+  it('returns null when reaction data is missing', () => {
+    expect(Keq_vh_shortcut_curve({ reaction: missing_component, temperatures_K: [500], model_source })).toBeNull();
+  });
+});
+
+describe('Keq_vh_shortcut_series', () => {
+  it('equals the scalar Keq_vh_shortcut per temperature', () => {
+    const temperature_list: Temperature[] = [298.15, 500, 1500, 3000].map((value) => ({ value, unit: 'K' }));
+    const series = Keq_vh_shortcut_series({ reaction: water_formation, temperature_list, model_source });
+    expect(series).toHaveLength(temperature_list.length);
+    series.forEach(({ temperature, result }) => {
+      const expected = Keq_vh_shortcut({ reaction: water_formation, temperature, model_source })!;
+      expect(result!.unit).toBe(expected.unit);
+      expectClose(result!.value, expected.value, 1e-12);
+    });
+  });
+
+  it('evaluates the standard state once per series', () => {
+    const temperature_list: Temperature[] = [400, 800, 1200, 2400, 4800].map((value) => ({ value, unit: 'K' }));
+    const spy = vi.spyOn(RXNAdapter.prototype, 'Keq');
+    try {
+      Keq_vh_shortcut_series({ reaction: water_formation, temperature_list, model_source });
+      expect(spy).toHaveBeenCalledTimes(1);
+    } finally {
+      spy.mockRestore();
+    }
+  });
+});
@@ -0,0 +1,11 @@
+import path from 'node:path';
+import { defineConfig } from 'vitest/config';
+
+// NOTE: mirror the tsconfig `@/*` path alias so behavior tests can import from src
+export default defineConfig({
+  resolve: {
+    alias: {
+      '@': path.resolve(__dirname, 'src')
+    }
+  }
+});